@@ -1,9 +1,11 @@
-from pywizlight.bulb import PilotBuilder, PilotParser, wizlight
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from pywizlight import discovery
-from pywizlight import tui
-from pywizlight.scenes import SCENES
-from pywizlight.bulblibrary import BulbType
+if TYPE_CHECKING:
+    from pywizlight import discovery, tui
+    from pywizlight.bulb import PilotBuilder, PilotParser, wizlight
+    from pywizlight.bulblibrary import BulbType
+    from pywizlight.scenes import SCENES
 
 __all__ = [
     "BulbType",
@@ -14,3 +16,32 @@ __all__ = [
     "wizlight",
     "tui",
 ]
+
+# Public name -> (module, attribute); attribute None exports the module itself.
+# Resolved on first access so importing e.g. SCENES does not pull in the
+# asyncio/UDP and curses stacks.
+_LAZY: Dict[str, Tuple[str, Optional[str]]] = {
+    "BulbType": ("pywizlight.bulblibrary", "BulbType"),
+    "discovery": ("pywizlight.discovery", None),
+    "PilotBuilder": ("pywizlight.bulb", "PilotBuilder"),
+    "PilotParser": ("pywizlight.bulb", "PilotParser"),
+    "SCENES": ("pywizlight.scenes", "SCENES"),
+    "wizlight": ("pywizlight.bulb", "wizlight"),
+    "tui": ("pywizlight.tui", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(__all__)
@@ -1,6 +1,7 @@
 """Command-line interface to interact with wizlight devices."""
 
 import asyncio
+import dataclasses
 from functools import wraps
 from typing import Any, Callable, Coroutine, TypeVar
 
@@ -41,7 +42,7 @@ async def discover(b: str) -> None:
 
     bulbs = await discovery.find_wizlights(broadcast_address=b)
     for bulb in bulbs:
-        click.echo(bulb.__dict__)
+        click.echo(dataclasses.asdict(bulb))
 
 
 @main.command("on")
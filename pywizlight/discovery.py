@@ -87,7 +87,7 @@ async def find_wizlights(
     await asyncio.sleep(wait_time)
     transport.close()
     await future
-    bulbs = registry.bulbs()
+    bulbs = registry.bulbs_list()
     for bulb in bulbs:
         _LOGGER.info(f"Discovered bulb {bulb.ip_address} with MAC {bulb.mac_address}")
     return bulbs
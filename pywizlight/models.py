@@ -1,10 +1,14 @@
 """Models."""
 
 import dataclasses
-from typing import Dict, List
+import sys
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class DiscoveredBulb:
     """Representation of discovered bulb."""
 
@@ -12,24 +16,87 @@ class DiscoveredBulb:
     mac_address: str
 
 
-def _bulb_map_factory() -> Dict[str, DiscoveredBulb]:
-    """Create the mapping used to store bulbs by their MAC address."""
+def _mac_key(mac: str) -> str:
+    """Return the registry key for a MAC address.
 
-    return {}
+    Every datagram yields a fresh MAC string, so the key is interned to let
+    repeated registrations of the same bulb hit the dict with a cached hash.
+    """
+    return sys.intern(mac.lower())
 
 
 @dataclasses.dataclass
 class BulbRegistry:
     """Representation of the bulb registry."""
 
-    bulbs_by_mac: Dict[str, DiscoveredBulb] = dataclasses.field(
-        default_factory=_bulb_map_factory
+    bulbs_by_mac: Dict[str, DiscoveredBulb] = dataclasses.field(default_factory=dict)
+    # MAC -> monotonic time the bulb was last registered, oldest first.
+    _last_seen: "OrderedDict[str, float]" = dataclasses.field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
     )
 
+    def __post_init__(self) -> None:
+        """Normalise the keys of the initial bulbs and mark them as seen now."""
+        self.bulbs_by_mac = {
+            _mac_key(mac): bulb for mac, bulb in self.bulbs_by_mac.items()
+        }
+        now = time.monotonic()
+        for mac in self.bulbs_by_mac:
+            self._last_seen[mac] = now
+
+    @property
+    def bulbs_by_mac_view(self) -> Mapping[str, DiscoveredBulb]:
+        """Read-only view of the bulbs registered so far.
+
+        register and expire publish a new dict instead of changing this one, so
+        the view can be iterated while discovery keeps registering bulbs.
+        """
+        return MappingProxyType(self.bulbs_by_mac)
+
     def register(self, bulb: DiscoveredBulb) -> None:
         """Register a new bulb."""
-        self.bulbs_by_mac[bulb.mac_address] = bulb
+        key = _mac_key(bulb.mac_address)
+        # Bulbs answer every broadcast; a repeat reply only refreshes last seen.
+        if self.bulbs_by_mac.get(key) != bulb:
+            self.bulbs_by_mac = {**self.bulbs_by_mac, key: bulb}
+        self._last_seen[key] = time.monotonic()
+        self._last_seen.move_to_end(key)
+
+    def expire(self, max_age: float) -> None:
+        """Drop bulbs that have not been seen for max_age seconds."""
+        cutoff = time.monotonic() - max_age
+        last_seen = self._last_seen
+        stale: List[str] = []
+        while last_seen:
+            mac, seen = next(iter(last_seen.items()))
+            if seen >= cutoff:
+                break
+            last_seen.popitem(last=False)
+            stale.append(mac)
+        if stale:
+            bulbs_by_mac = dict(self.bulbs_by_mac)
+            for mac in stale:
+                # The entry may already have been removed from bulbs_by_mac directly.
+                bulbs_by_mac.pop(mac, None)
+            self.bulbs_by_mac = bulbs_by_mac
+
+    def bulbs(self, max_age: Optional[float] = None) -> Iterable[DiscoveredBulb]:
+        """Iterate present bulbs, optionally only those seen within max_age.
+
+        The bulbs are those registered at the time of the call. Bulbs written
+        into bulbs_by_mac directly were never seen by register and count as
+        fresh.
+        """
+        if max_age is None:
+            return self.bulbs_by_mac.values()
+        cutoff = time.monotonic() - max_age
+        last_seen = self._last_seen
+        return (
+            bulb
+            for mac, bulb in self.bulbs_by_mac.items()
+            if last_seen.get(mac, cutoff) >= cutoff
+        )
 
-    def bulbs(self) -> List[DiscoveredBulb]:
-        """Get all present bulbs."""
-        return list(self.bulbs_by_mac.values())
+    def bulbs_list(self, max_age: Optional[float] = None) -> List[DiscoveredBulb]:
+        """Get a list of present bulbs, optionally only those seen within max_age."""
+        return list(self.bulbs(max_age))
@@ -0,0 +1,98 @@
+"""Tests for the models."""
+
+import copy
+import dataclasses
+from unittest.mock import patch
+
+import pytest
+
+from pywizlight.models import BulbRegistry, DiscoveredBulb
+
+
+@pytest.mark.asyncio
+async def test_registry_normalizes_mac() -> None:
+    """Test registering the same bulb twice keeps one entry."""
+    registry = BulbRegistry()
+    registry.register(DiscoveredBulb("1.2.3.4", "D8A01199CF31"))
+    registry.register(DiscoveredBulb("1.2.3.5", "d8a01199cf31"))
+    assert list(registry.bulbs_by_mac) == ["d8a01199cf31"]
+    assert registry.bulbs_list() == [DiscoveredBulb("1.2.3.5", "d8a01199cf31")]
+
+
+@pytest.mark.asyncio
+async def test_registry_normalizes_initial_keys() -> None:
+    """Test bulbs passed at creation share keys with later registrations."""
+    registry = BulbRegistry({"AA": DiscoveredBulb("1.2.3.4", "AA")})
+    registry.register(DiscoveredBulb("1.2.3.5", "AA"))
+    assert list(registry.bulbs_by_mac) == ["aa"]
+    assert registry.bulbs_list() == [DiscoveredBulb("1.2.3.5", "AA")]
+    registry.expire(60)
+    assert registry.bulbs_list() == [DiscoveredBulb("1.2.3.5", "AA")]
+
+
+@pytest.mark.asyncio
+async def test_registry_max_age_and_expire() -> None:
+    """Test stale bulbs are filtered and expired."""
+    registry = BulbRegistry()
+    old = DiscoveredBulb("1.2.3.4", "aaaaaaaaaaaa")
+    new = DiscoveredBulb("1.2.3.5", "bbbbbbbbbbbb")
+    with patch("pywizlight.models.time.monotonic", return_value=100.0):
+        registry.register(old)
+    with patch("pywizlight.models.time.monotonic", return_value=110.0):
+        registry.register(new)
+    with patch("pywizlight.models.time.monotonic", return_value=112.0):
+        assert registry.bulbs_list(max_age=5) == [new]
+        assert registry.bulbs_list() == [old, new]
+        registry.expire(5)
+        assert registry.bulbs_list() == [new]
+    with patch("pywizlight.models.time.monotonic", return_value=120.0):
+        registry.register(old)
+        registry.expire(5)
+    assert registry.bulbs_list() == [old]
+
+
+@pytest.mark.asyncio
+async def test_registry_tolerates_direct_writes() -> None:
+    """Test bulbs written to or removed from bulbs_by_mac directly do not break it."""
+    registry = BulbRegistry()
+    registry.register(DiscoveredBulb("1.2.3.4", "aaaaaaaaaaaa"))
+    direct = DiscoveredBulb("1.2.3.5", "dd")
+    registry.bulbs_by_mac["dd"] = direct
+    assert direct in registry.bulbs_list(max_age=10)
+    del registry.bulbs_by_mac["aaaaaaaaaaaa"]
+    registry.expire(-1)
+    assert registry.bulbs_list() == [direct]
+
+
+@pytest.mark.asyncio
+async def test_registry_view_is_read_only() -> None:
+    """Test bulbs_by_mac_view is read-only and stable while bulbs register."""
+    registry = BulbRegistry()
+    registry.register(DiscoveredBulb("1.2.3.4", "aaaaaaaaaaaa"))
+    view = registry.bulbs_by_mac_view
+    with pytest.raises(TypeError):
+        view["bbbbbbbbbbbb"] = DiscoveredBulb("1.2.3.5", "x")  # type: ignore[index]
+    seen = []
+    for mac in view:
+        seen.append(mac)
+        registry.register(DiscoveredBulb("1.2.3.5", "bbbbbbbbbbbb"))
+    assert seen == ["aaaaaaaaaaaa"]
+    assert list(registry.bulbs_by_mac_view) == ["aaaaaaaaaaaa", "bbbbbbbbbbbb"]
+    for bulb in registry.bulbs():
+        registry.expire(-1)
+    assert registry.bulbs_list() == []
+
+
+@pytest.mark.asyncio
+async def test_registry_asdict_and_deepcopy() -> None:
+    """Test the registry still works with dataclass introspection and copying."""
+    bulb = DiscoveredBulb("1.2.3.4", "aaaaaaaaaaaa")
+    registry = BulbRegistry()
+    registry.register(bulb)
+    assert dataclasses.asdict(registry)["bulbs_by_mac"] == {
+        "aaaaaaaaaaaa": {"ip_address": "1.2.3.4", "mac_address": "aaaaaaaaaaaa"}
+    }
+    clone = copy.deepcopy(registry)
+    assert clone == registry
+    assert clone.bulbs_list() == [bulb]
+    assert repr(registry).startswith("BulbRegistry(bulbs_by_mac={")
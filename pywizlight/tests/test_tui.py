@@ -0,0 +1,684 @@
+"""Tests for the TUI controller."""
+
+import asyncio
+import curses
+import queue
+import re
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Generator, List, Tuple
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pywizlight import PilotParser, wizlight
+from pywizlight import bulb as bulb_module
+from pywizlight.models import DiscoveredBulb
+from pywizlight.tests.fake_bulb import startup_bulb
+from pywizlight.tui import BulbInfo, BulbStateUpdate, WizAsyncController, WizTUI
+
+
+class FakeWindow:
+    """Minimal stand-in for a curses window."""
+
+    def __init__(self, height: int = 24, width: int = 120) -> None:
+        self.size = (height, width)
+        self.lines: List[str] = [""] * height
+        self.writes: List[int] = []
+        self.typed = b""
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.size
+
+    def addnstr(self, y: int, x: int, text: str, width: int, attr: int) -> None:
+        line = self.lines[y].ljust(x)[:x] + text[:width]
+        self.lines[y] = line.rstrip()
+        self.writes.append(y)
+
+    def hline(self, y: int, x: int, ch: int, n: int) -> None:
+        # Padding after addnstr on the same line counts as one write.
+        if not self.writes or self.writes[-1] != y or x == 0:
+            self.writes.append(y)
+        line = self.lines[y].ljust(x)[:x] + chr(ch & 0xFF) * n
+        self.lines[y] = line.rstrip()
+
+    def erase(self) -> None:
+        self.lines = [""] * self.size[0]
+
+    def refresh(self) -> None:
+        pass
+
+    def noutrefresh(self) -> None:
+        pass
+
+    def timeout(self, delay: int) -> None:
+        pass
+
+    def getstr(self, y: int, x: int, n: int) -> bytes:
+        return self.typed[:n]
+
+
+@pytest.fixture()
+def controller() -> Generator[WizAsyncController, None, None]:
+    controller = WizAsyncController(broadcast_address="127.0.0.1", wait_time=0.02)
+    yield controller
+    controller.shutdown()
+
+
+def _start_bulbs(
+    controller: WizAsyncController, count: int
+) -> Tuple[List[BulbInfo], Callable[[], None]]:
+    """Start fake bulbs and wizlights on the controller loop."""
+
+    async def _start() -> Tuple[List[BulbInfo], List[Callable]]:
+        bulbs: List[BulbInfo] = []
+        shutdowns: List[Callable] = []
+        for _ in range(count):
+            shutdown, port = await startup_bulb(
+                module_name="ESP01_SHRGB_03", firmware_version="1.25.0"
+            )
+            light = wizlight(ip="127.0.0.1", port=port)
+            bulbs.append(BulbInfo(device=light, ip="127.0.0.1", mac=None, state=None))
+            shutdowns.append(shutdown)
+        return bulbs, shutdowns
+
+    bulbs, shutdowns = controller._submit(_start()).result(timeout=5)
+
+    def _shutdown() -> None:
+        for bulb in bulbs:
+            controller._submit(bulb.device.async_close()).result(timeout=5)
+        for shutdown in shutdowns:
+            controller._loop.call_soon_threadsafe(shutdown)
+
+    return bulbs, _shutdown
+
+
+def _apply_all(
+    controller: WizAsyncController,
+    bulbs: List[BulbInfo],
+    make_coro: Callable[[wizlight], Coroutine[Any, Any, BulbStateUpdate]],
+) -> List[BulbStateUpdate]:
+    """Run make_coro on every bulb through apply_async and wait for all results."""
+    done: "queue.SimpleQueue[Tuple[BulbInfo, BulbStateUpdate]]" = queue.SimpleQueue()
+    controller.apply_async(bulbs, make_coro, lambda bulb, result: done.put((bulb, result)))
+    pairs = [done.get(timeout=5) for _ in bulbs]
+    pairs.sort(key=lambda pair: next(idx for idx, bulb in enumerate(bulbs) if bulb is pair[0]))
+    return [result for _, result in pairs]
+
+
+def test_set_power_for_group(controller: WizAsyncController) -> None:
+    """Test turning a group of bulbs on concurrently."""
+    bulbs, shutdown = _start_bulbs(controller, 3)
+    try:
+        results = _apply_all(
+            controller, bulbs, lambda device: controller.async_set_power(device, True)
+        )
+        assert len(results) == 3
+        for bulb, result in zip(bulbs, results):
+            assert result.error is None
+            assert result.state is True
+            result.apply(bulb)
+            assert bulb.state is True
+        results = _apply_all(
+            controller, bulbs, lambda device: controller.async_set_brightness(device, 128)
+        )
+        assert [result.brightness for result in results] == [128, 128, 128]
+    finally:
+        shutdown()
+
+
+def test_group_operation_reports_errors(controller: WizAsyncController) -> None:
+    """Test a failing coroutine becomes an error result for that bulb only."""
+    bulbs, shutdown = _start_bulbs(controller, 2)
+
+    async def _fail(device: wizlight):
+        raise ValueError("boom")
+
+    try:
+        results = _apply_all(controller, bulbs[:1], _fail)
+        results += _apply_all(controller, bulbs[1:], controller.async_refresh_state)
+        assert results[0].error == "boom"
+        assert results[1].error is None
+        assert results[1].state is False
+    finally:
+        shutdown()
+
+
+def test_group_operation_times_out_slow_bulbs() -> None:
+    """Test a bulb that never answers times out without holding up the rest."""
+    controller = WizAsyncController(
+        broadcast_address="127.0.0.1", wait_time=0.02, per_bulb_timeout=0.05
+    )
+    bulbs = [
+        BulbInfo(device=name, ip=name, mac=None, state=None)  # type: ignore[arg-type]
+        for name in ("slow", "fast")
+    ]
+
+    async def _op(device: str) -> BulbStateUpdate:
+        if device == "slow":
+            await asyncio.sleep(10)
+        return BulbStateUpdate(state=True)
+
+    try:
+        start = time.monotonic()
+        results = _apply_all(controller, bulbs, _op)  # type: ignore[arg-type]
+        assert time.monotonic() - start < 1
+        assert [result.error for result in results] == ["timeout", None]
+    finally:
+        controller.shutdown()
+
+
+def test_per_bulb_timeout_covers_library_resends(controller: WizAsyncController) -> None:
+    """Test bulb operations wait as long as wizlight keeps resending by default."""
+    assert controller.per_bulb_timeout == bulb_module.TIMEOUT
+
+
+def test_blocking_call_uses_per_bulb_timeout(controller: WizAsyncController) -> None:
+    """Test the blocking set_* wrappers wait as long as one bulb operation."""
+    bulbs, shutdown = _start_bulbs(controller, 1)
+    try:
+        with patch.object(controller, "_await", wraps=controller._await) as wait:
+            assert controller.set_power(bulbs[0], True).state is True
+        assert wait.call_args.args[1] == controller.per_bulb_timeout
+    finally:
+        shutdown()
+
+
+def test_await_timeout_cancels_work(controller: WizAsyncController) -> None:
+    """Test a blocking call that times out cancels its coroutine on the loop."""
+    cancelled = []
+
+    async def _hang() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return 0
+
+    with pytest.raises(TimeoutError):
+        controller._await(controller._submit(_hang()), 0.05)
+    deadline = time.monotonic() + 5
+    while not cancelled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cancelled == [True]
+
+
+def test_shutdown_cancels_work_in_flight() -> None:
+    """Test shutdown cancels outstanding operations instead of waiting on them."""
+    controller = WizAsyncController(broadcast_address="127.0.0.1", wait_time=0.02)
+
+    async def _hang() -> int:
+        await asyncio.sleep(10)
+        return 0
+
+    hung = controller._submit(_hang())
+    start = time.monotonic()
+    controller.shutdown()
+    assert time.monotonic() - start < 1
+    assert hung.cancelled()
+    assert controller._loop.is_closed()
+
+
+def test_submit_many_runs_batch(controller: WizAsyncController) -> None:
+    """Test a submitted batch resolves each future, including errors and cancels."""
+
+    async def _value(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    async def _fail() -> int:
+        raise ValueError("boom")
+
+    async def _hang() -> int:
+        await asyncio.sleep(10)
+        return 0
+
+    ok, failed, hung = controller._submit_many([_value(1), _fail(), _hang()])
+    assert ok.result(timeout=5) == 1
+    with pytest.raises(ValueError, match="boom"):
+        failed.result(timeout=5)
+    assert hung.cancel()
+    assert hung.cancelled()
+
+
+def test_apply_async_delivers_each_result(controller: WizAsyncController) -> None:
+    """Test apply_async calls back per bulb, turning failures into error updates."""
+    bulbs = [
+        BulbInfo(device=name, ip=name, mac=None, state=None)  # type: ignore[arg-type]
+        for name in ("ok", "bad")
+    ]
+    delivered: "queue.SimpleQueue[Tuple[str, BulbStateUpdate]]" = queue.SimpleQueue()
+
+    async def _op(device: str) -> BulbStateUpdate:
+        if device == "bad":
+            raise ValueError("boom")
+        return BulbStateUpdate(state=True)
+
+    controller.apply_async(
+        bulbs, _op, lambda bulb, result: delivered.put((bulb.ip, result))
+    )
+    results = dict(delivered.get(timeout=5) for _ in bulbs)
+    assert results["ok"].state is True
+    assert results["bad"].error == "boom"
+
+
+def test_empty_update_is_shared() -> None:
+    """Test empty updates are one shared, immutable instance."""
+    empty = BulbStateUpdate.empty()
+    assert empty is BulbStateUpdate.empty()
+    assert WizAsyncController._extract_details(None) is empty
+    with pytest.raises(AttributeError):
+        empty.error = "boom"  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    "pilot, rgb",
+    [
+        ({"state": True, "r": 255, "g": 128, "b": 0}, (255, 128, 0)),
+        ({"state": True, "r": 255, "g": 128}, None),
+        ({"state": True, "temp": 2700}, None),
+    ],
+)
+def test_extract_details_rgb(pilot, rgb) -> None:
+    """Test rgb is only reported when all three channels are present."""
+    details = WizAsyncController._extract_details(PilotParser(pilot))
+    assert details.state is True
+    assert details.rgb == rgb
+
+
+def test_discover_fetches_state_for_each_bulb(controller: WizAsyncController) -> None:
+    """Test discovery refreshes every found bulb and sorts them by ip."""
+    bulbs, shutdown = _start_bulbs(controller, 2)
+    # Key the fake bulbs by made up addresses; the lights still talk to loopback.
+    controller._lights = {"10.0.0.2": bulbs[0].device, "10.0.0.1": bulbs[1].device}
+    found = [
+        DiscoveredBulb("10.0.0.2", "aaaaaaaaaaaa"),
+        DiscoveredBulb("10.0.0.1", "bbbbbbbbbbbb"),
+    ]
+    try:
+        with patch(
+            "pywizlight.tui.discovery.find_wizlights", AsyncMock(return_value=found)
+        ):
+            infos = controller.discover()
+        assert [info.ip for info in infos] == ["10.0.0.1", "10.0.0.2"]
+        assert [info.mac for info in infos] == ["bbbbbbbbbbbb", "aaaaaaaaaaaa"]
+        assert all(info.state is False and info.last_error is None for info in infos)
+    finally:
+        shutdown()
+
+
+def test_discover_reuses_recent_scan(controller: WizAsyncController) -> None:
+    """Test a second scan inside the interval skips the broadcast unless forced."""
+    bulbs, shutdown = _start_bulbs(controller, 1)
+    controller._lights = {"10.0.0.1": bulbs[0].device}
+    found = [DiscoveredBulb("10.0.0.1", "aaaaaaaaaaaa")]
+    find = AsyncMock(return_value=found)
+    try:
+        with patch("pywizlight.tui.discovery.find_wizlights", find):
+            controller.discover()
+            infos = controller.discover()
+            assert find.await_count == 1
+            assert [info.ip for info in infos] == ["10.0.0.1"]
+            assert infos[0].state is False
+            controller.discover(force=True)
+            assert find.await_count == 2
+    finally:
+        shutdown()
+
+
+def test_discover_bounds_queued_fetches(controller: WizAsyncController) -> None:
+    """Test bulbs queued behind unresponsive ones still fit in the scan budget."""
+
+    async def _hang() -> None:
+        await asyncio.sleep(10)
+
+    lights = {}
+    for idx in range(3):
+        light = AsyncMock()
+        light.updateState.side_effect = _hang
+        lights[f"10.0.0.{idx}"] = light
+    controller._lights = dict(lights)
+    controller.fetch_timeout = 0.05
+    found = [DiscoveredBulb(ip, "aaaaaaaaaaaa") for ip in lights]
+    with patch("pywizlight.tui._DISCOVERY_CONCURRENCY", 1), patch.object(
+        WizAsyncController, "_discover_timeout", 0.12
+    ), patch("pywizlight.tui.discovery.find_wizlights", AsyncMock(return_value=found)):
+        infos = controller.discover()
+    assert [info.last_error for info in infos] == ["timeout"] * 3
+
+
+def test_discover_keeps_missing_bulbs_open(controller: WizAsyncController) -> None:
+    """Test a bulb missing from a few broadcasts keeps its socket until the limit."""
+    light = AsyncMock()
+    controller._lights = {"10.0.0.1": light}
+    with patch("pywizlight.tui.discovery.find_wizlights", AsyncMock(return_value=[])):
+        assert controller.discover(force=True) == []
+        assert controller.discover(force=True) == []
+        assert controller._lights == {"10.0.0.1": light}
+        assert controller.discover() == []
+        light.updateState.assert_not_awaited()
+        controller.discover(force=True)
+    assert controller._lights == {}
+    light.async_close.assert_awaited_once()
+
+
+def test_discover_is_single_flight(controller: WizAsyncController) -> None:
+    """Test scans requested while one is running share it."""
+    release = asyncio.Event()
+
+    async def _find(**kwargs):
+        await release.wait()
+        return []
+
+    with patch("pywizlight.tui.discovery.find_wizlights", side_effect=_find) as find:
+        first = controller.discover_async()
+        assert controller.discover_async(force=True) is first
+        controller._loop.call_soon_threadsafe(release.set)
+        assert first.result(timeout=5) == []
+        assert find.call_count == 1
+        second = controller.discover_async(force=True)
+        assert second is not first
+        assert second.result(timeout=5) == []
+        assert find.call_count == 2
+
+
+def test_refresh_state_joins_fetch_in_flight(controller: WizAsyncController) -> None:
+    """Test concurrent refreshes of one bulb send a single state request."""
+    bulbs, shutdown = _start_bulbs(controller, 1)
+    device = bulbs[0].device
+    try:
+        with patch.object(device, "updateState", wraps=device.updateState) as update:
+            results = _apply_all(
+                controller, [bulbs[0], bulbs[0]], controller.async_refresh_state
+            )
+            assert update.call_count == 1
+            assert [result.state for result in results] == [False, False]
+            controller.refresh_state(bulbs[0])
+            assert update.call_count == 2
+    finally:
+        shutdown()
+
+
+def test_group_action_reports_progress(controller: WizAsyncController) -> None:
+    """Test group actions return immediately and finish as results arrive."""
+    bulbs, shutdown = _start_bulbs(controller, 2)
+    window = FakeWindow()
+    ui = WizTUI(window, controller)
+    ui.bulbs = bulbs
+    ui.group_mode = True
+    try:
+        ui.set_selected(True)
+        deadline = time.monotonic() + 5
+        while ui._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+            ui._drain_results()
+        assert not ui._pending
+        assert ui.status_message == "Turned on 2 bulbs."
+        assert [bulb.state for bulb in bulbs] == [True, True]
+        ui.draw()
+        assert window.lines[2].startswith("[ON ] ")
+        assert "(127.0.0.1)" in window.lines[2]
+    finally:
+        shutdown()
+
+
+def test_draw_repaints_only_changed_lines(controller: WizAsyncController) -> None:
+    """Test redraws only write the lines whose content changed."""
+    window = FakeWindow(height=10)
+    ui = WizTUI(window, controller)
+    ui.bulbs = [
+        BulbInfo(device=None, ip=f"10.0.0.{idx}", mac=None, state=None)  # type: ignore[arg-type]
+        for idx in range(3)
+    ]
+    ui.draw()
+    assert window.writes == list(range(10))
+    window.writes.clear()
+    ui.draw()
+    assert window.writes == []
+    ui.status_message = "Working..."
+    ui.draw()
+    assert window.writes == [9]
+    assert window.lines[9] == "Working..."
+    window.writes.clear()
+    ui._move_selection(1)
+    ui.draw()
+    assert window.writes == [2, 3]
+    window.writes.clear()
+    BulbStateUpdate(state=True).apply(ui.bulbs[2])
+    ui._bump_bulbs()
+    ui.draw()
+    assert window.writes == [4]
+    assert window.lines[4].startswith("[ON ] ")
+    window.writes.clear()
+    ui.bulbs = ui.bulbs[:1]
+    ui.draw()
+    assert window.writes == [3, 4]
+    assert window.lines[3:5] == ["", ""]
+
+
+def test_footer_stops_short_of_bottom_right_cell(controller: WizAsyncController) -> None:
+    """Test a full-width footer leaves the last cell to hline so curses cannot raise."""
+    window = FakeWindow(height=5, width=20)
+    calls = []
+    window.addnstr = lambda y, x, text, width, attr: calls.append((y, width))  # type: ignore[method-assign]
+    ui = WizTUI(window, controller)
+    ui.status_message = "x" * 30
+    ui.draw()
+    assert (0, 20) in calls
+    assert (4, 19) in calls
+
+
+def test_header_reflects_modes(controller: WizAsyncController) -> None:
+    """Test the title bar shows the group and scene list markers."""
+    window = FakeWindow()
+    ui = WizTUI(window, controller)
+    ui.draw()
+    assert window.lines[0].startswith(" pywizlight TUI  r:scan")
+    ui.group_mode = True
+    ui.show_scene_list = True
+    ui._invalidate("header")
+    ui.draw()
+    assert window.lines[0].startswith(" pywizlight TUI [GROUP] [SCENES]  r:scan")
+
+
+def test_handle_key_dispatch(controller: WizAsyncController) -> None:
+    """Test bound keys reach their handler and unknown keys are ignored."""
+    ui = WizTUI(FakeWindow(), controller)
+    ui.bulbs = [
+        BulbInfo(device=None, ip=f"10.0.0.{idx}", mac=None, state=None)  # type: ignore[arg-type]
+        for idx in range(3)
+    ]
+    assert ui._handle_key(ord("j")) is True
+    assert ui._handle_key(curses.KEY_DOWN) is True
+    assert ui.selected_index == 2
+    assert ui._handle_key(10_000) is True
+    assert ui._handle_key(-5) is True
+    assert ui.selected_index == 2
+    assert ui._handle_key(ord("q")) is False
+    ui._handle_key(ord("l"))
+    assert ui._handle_key(ord("j")) is True
+    assert (ui.selected_index, ui.scene_list_index) == (2, 1)
+    assert ui._handle_key(ord("k")) is True
+    assert ui.scene_list_index == 0
+    ui._handle_key(ord("l"))
+    assert ui.show_scene_list is False
+
+
+def test_scene_list_scrolls_with_selection(controller: WizAsyncController) -> None:
+    """Test the scene list window follows the highlighted scene."""
+    window = FakeWindow(height=8)
+    ui = WizTUI(window, controller)
+    ui.toggle_scene_list()
+    ui.draw()
+    assert window.lines[1] == "   1: Ocean"
+    assert window.lines[6] == "   6: Cozy"
+    for _ in range(10):
+        ui._handle_scene_list_key(ord("j"))
+    ui.draw()
+    assert window.lines[1] == "... earlier scenes ..."
+    assert window.lines[2] == "   8: Pastel colors"
+    assert "  11: Warm white" in window.lines[2:7]
+    assert ui.status_message.endswith("11: Warm white")
+
+
+def test_format_bulb_line(controller: WizAsyncController) -> None:
+    """Test the bulb row lists scene, brightness, colour and error details."""
+    ui = WizTUI(FakeWindow(), controller)
+    bulb = BulbInfo(
+        device=None,  # type: ignore[arg-type]
+        ip="10.0.0.1",
+        mac="aabbccddeeff",
+        state=False,
+        brightness=50,
+        rgb=(1, 2, 3),
+        scene_id=1,
+        last_error="timeout",
+    )
+    assert ui._format_bulb_line(bulb) == (
+        "[OFF] aabbccddeeff (10.0.0.1)  scene=1:Ocean  bri=50  rgb=1,2,3  ! timeout"
+    )
+
+
+def test_format_status_summary(controller: WizAsyncController) -> None:
+    """Test the single bulb summary lists brightness, colour and scene."""
+    ui = WizTUI(FakeWindow(), controller)
+    bulb = BulbInfo(device=None, ip="10.0.0.1", mac=None, state=True, scene_id=1)  # type: ignore[arg-type]
+    assert ui._format_status_summary(bulb) == "on (scene 1:Ocean)"
+    bulb.scene_id, bulb.brightness, bulb.rgb = 999, 10, (1, 2, 3)
+    assert ui._format_status_summary(bulb) == "on (bri 10, rgb 1,2,3, scene 999)"
+
+
+def test_format_failure_summary(controller: WizAsyncController) -> None:
+    """Test failure summaries list the first two failures."""
+    ui = WizTUI(FakeWindow(), controller)
+    bulbs = [
+        BulbInfo(device=None, ip=f"10.0.0.{idx}", mac=None, state=None)  # type: ignore[arg-type]
+        for idx in range(3)
+    ]
+    failures = [(bulb, "timeout") for bulb in bulbs]
+    assert ui._format_failure_summary("Turned on", 1, 3, failures[:1]) == (
+        "Turned on 1/3 bulbs (failures: 10.0.0.0: timeout)"
+    )
+    assert ui._format_failure_summary("Turned on", 0, 3, failures) == (
+        "Turned on 0/3 bulbs (failures: 10.0.0.0: timeout; 10.0.0.1: timeout; ...)"
+    )
+
+
+def test_prompt_reads_footer_input(controller: WizAsyncController) -> None:
+    """Test prompts are drawn on the footer line and return the stripped input."""
+    window = FakeWindow(height=10)
+    ui = WizTUI(window, controller)
+    ui.draw()
+    window.typed = b"  ocean \n"
+    assert ui._prompt("Scene: ") == "ocean"
+    assert window.lines[9] == "Scene:"
+    window.typed = b"   "
+    assert ui._prompt("Scene: ") is None
+    ui.draw()
+    assert window.lines[9] == ui.status_message
+
+
+def test_row_text_cached_until_fields_change(controller: WizAsyncController) -> None:
+    """Test bulb rows are formatted once and reformatted when a shown field changes."""
+    ui = WizTUI(FakeWindow(), controller)
+    bulb = BulbInfo(device=None, ip="10.0.0.1", mac=None, state=None)  # type: ignore[arg-type]
+    with patch.object(ui, "_format_bulb_line", wraps=ui._format_bulb_line) as fmt:
+        assert ui._bulb_line(bulb) == "[???] 10.0.0.1 (10.0.0.1)"
+        assert ui._bulb_line(bulb) == "[???] 10.0.0.1 (10.0.0.1)"
+        assert fmt.call_count == 1
+        BulbStateUpdate(state=True, brightness=10).apply(bulb)
+        assert ui._bulb_line(bulb) == "[ON ] 10.0.0.1 (10.0.0.1)  bri=10"
+        bulb.mac = "aabbccddeeff"
+        assert ui._bulb_line(bulb) == "[ON ] aabbccddeeff (10.0.0.1)  bri=10"
+        assert fmt.call_count == 3
+
+
+def test_refresh_bulbs_does_not_block(controller: WizAsyncController) -> None:
+    """Test a scan runs in the background and its result lands on the UI thread."""
+    ui = WizTUI(FakeWindow(), controller)
+    scan: Future = Future()
+    with patch.object(controller, "discover_async", return_value=scan) as discover:
+        ui.refresh_bulbs()
+        assert ui.status_message == "Scanning for bulbs..."
+        ui.refresh_bulbs()
+        assert ui.status_message == "Scan already in progress..."
+        assert discover.call_count == 1
+        scan.set_result([BulbInfo(device=None, ip="10.0.0.1", mac=None, state=None)])  # type: ignore[arg-type]
+        ui._drain_results()
+        assert [bulb.ip for bulb in ui.bulbs] == ["10.0.0.1"]
+        assert ui.status_message == "Found 1 bulb. Press l to view scenes."
+        ui.refresh_bulbs(force=True)
+        assert discover.call_count == 2
+        discover.assert_called_with(force=True)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("255,128,0", (255, 128, 0)),
+        (" 1 2, 3 ", (1, 2, 3)),
+        (",1,,2,3", (1, 2, 3)),
+        ("#FF8000", (255, 128, 0)),
+        ("#ff8000", (255, 128, 0)),
+    ],
+)
+def test_parse_rgb_input(controller: WizAsyncController, text, expected) -> None:
+    """Test the RGB prompt parser accepts decimal and hex forms."""
+    assert WizTUI(FakeWindow(), controller)._parse_rgb_input(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("", "RGB value is required."),
+        ("#FF80", "RGB hex must be in the form #RRGGBB."),
+        ("#GG8000", "RGB hex must be in the form #RRGGBB."),
+        ("#-F8000", "RGB hex must be in the form #RRGGBB."),
+        ("#F_8000", "RGB hex must be in the form #RRGGBB."),
+        ("#FF 800", "RGB hex must be in the form #RRGGBB."),
+        ("1,2", "RGB must have three components (e.g. 255,128,0)."),
+        ("1,x,3", "RGB components must be integers."),
+        ("1,256,3", "RGB components must be between 0 and 255."),
+        ("-1,2,3", "RGB components must be between 0 and 255."),
+    ],
+)
+def test_parse_rgb_input_errors(controller: WizAsyncController, text, message) -> None:
+    """Test the RGB prompt parser error messages."""
+    with pytest.raises(ValueError, match=re.escape(message)):
+        WizTUI(FakeWindow(), controller)._parse_rgb_input(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("12", 12), ("ocean", 1), ("  Warm White ", 11), ("light", 29)],
+)
+def test_resolve_scene(controller: WizAsyncController, text, expected) -> None:
+    """Test scene lookup by id, exact name and partial name."""
+    assert WizTUI(FakeWindow(), controller)._resolve_scene(text) == expected
+
+
+@pytest.mark.parametrize(
+    "message, attr",
+    [
+        ("Error: bulb did not answer", "attr_footer_error"),
+        ("Turned on 1 bulb, 1 FAILED", "attr_footer_error"),
+        ("Scene list opened", "attr_footer_info"),
+        ("Group mode enabled", "attr_footer_info"),
+        ("Found 2 bulbs", "attr_footer"),
+    ],
+)
+def test_footer_attr(controller: WizAsyncController, message, attr) -> None:
+    """Test the footer colour follows the status message keywords."""
+    ui = WizTUI(FakeWindow(), controller)
+    ui.attr_footer, ui.attr_footer_info, ui.attr_footer_error = 1, 2, 3
+    ui.status_message = message
+    assert ui._footer_attr() == getattr(ui, attr)
+    assert ui._footer_attr() == getattr(ui, attr)
+
+
+@pytest.mark.parametrize("text", ["nope", "-1", "²"])
+def test_resolve_scene_unknown(controller: WizAsyncController, text) -> None:
+    """Test unknown scenes raise."""
+    with pytest.raises(ValueError, match="Unknown scene"):
+        WizTUI(FakeWindow(), controller)._resolve_scene(text)
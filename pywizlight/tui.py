@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import logging
+import queue
 import re
 import threading
+import time
 from concurrent.futures import Future, TimeoutError
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 from typing import (
     TYPE_CHECKING,
@@ -16,14 +19,17 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Set,
     Tuple,
     TypeVar,
 )
 
 from . import discovery, wizlight
-from .bulb import PilotBuilder
+from .bulb import TIMEOUT, PilotBuilder
 from .scenes import SCENES
 
+_LOGGER = logging.getLogger(__name__)
+
 try:
     import curses
 except ImportError as exc:  # pragma: no cover - platform dependent
@@ -32,6 +38,14 @@ except ImportError as exc:  # pragma: no cover - platform dependent
 else:  # pragma: no cover - platform dependent
     _curses_import_error = None
 
+# uvloop is optional (and unavailable on Windows); fall back to the stock loop.
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    _new_event_loop: Callable[[], asyncio.AbstractEventLoop] = asyncio.new_event_loop
+else:  # pragma: no cover - optional dependency
+    _new_event_loop = uvloop.new_event_loop
+
 if TYPE_CHECKING:  # pragma: no cover - typing helper
 
     class CursesWindow(Protocol):
@@ -39,6 +53,8 @@ if TYPE_CHECKING:  # pragma: no cover - typing helper
 
         def keypad(self, flag: bool) -> None: ...
 
+        def timeout(self, delay: int) -> None: ...
+
         def getch(self) -> int: ...
 
         def erase(self) -> None: ...
@@ -47,6 +63,10 @@ if TYPE_CHECKING:  # pragma: no cover - typing helper
 
         def refresh(self) -> None: ...
 
+        def hline(self, y: int, x: int, ch: int, n: int) -> None: ...
+
+        def noutrefresh(self) -> None: ...
+
         def addnstr(self, y: int, x: int, text: str, width: int, attr: int) -> None: ...
 
         def move(self, y: int, x: int) -> None: ...
@@ -62,8 +82,45 @@ RGBTuple = Tuple[int, int, int]
 
 _T = TypeVar("_T")
 
-
-@dataclass
+# Upper bound on concurrent state fetches after a discovery broadcast.
+_DISCOVERY_CONCURRENCY = 32
+# Broadcasts in a row a known bulb may miss before its socket is closed.
+_DISCOVERY_MAX_MISSES = 3
+# How long getch waits before the UI loop checks for finished bulb operations.
+_RESULT_POLL_MS = 100
+
+_SCENE_BY_NAME: Dict[str, int] = {name.lower(): scene_id for scene_id, name in SCENES.items()}
+# Lowercased names in SCENES order, so partial matches keep their precedence.
+_SCENE_LOWER_PAIRS: List[Tuple[int, str]] = [(scene_id, name.lower()) for scene_id, name in SCENES.items()]
+# SCENES never changes at runtime, so sort it once for the scene list. Tuples,
+# because _scene_items() hands the shared sequence to callers.
+_SCENE_ITEMS: Tuple[Tuple[int, str], ...] = tuple(sorted(SCENES.items()))
+_SCENE_LABELS: Tuple[str, ...] = tuple(f"{scene_id:>4}: {name}" for scene_id, name in _SCENE_ITEMS)
+# Scene fragments for the bulb rows and the status summary respectively.
+_SCENE_DETAIL: Dict[int, str] = {scene_id: f"scene={scene_id}:{name}" for scene_id, name in SCENES.items() if name}
+_SCENE_STATUS: Dict[int, str] = {scene_id: f"scene {scene_id}:{name}" for scene_id, name in SCENES.items() if name}
+_FOOTER_ERROR_RE = re.compile(r"error|fail|timeout|invalid", re.IGNORECASE)
+_FOOTER_INFO_RE = re.compile(r"scene list|brightness|color|rgb|scene|group", re.IGNORECASE)
+_SPACE = ord(" ")
+# Bulb power state as shown in the bulb rows and in status summaries.
+_STATE_LABEL: Dict[Optional[bool], str] = {True: "ON ", False: "OFF", None: "???"}
+_STATE_WORD: Dict[Optional[bool], str] = {True: "on", False: "off", None: "unknown"}
+_HEADER_KEYS = "  r:scan R:rescan space:toggle o:on f:off b:bri c:rgb n:scene g:group l:list enter:apply s:status q:quit "
+# (group_mode, show_scene_list) -> title bar text.
+_HEADERS: Dict[Tuple[bool, bool], str] = {
+    (group, scenes): " pywizlight TUI"
+    + (" [GROUP]" if group else "")
+    + (" [SCENES]" if scenes else "")
+    + _HEADER_KEYS
+    for group in (False, True)
+    for scenes in (False, True)
+}
+# Screen regions draw() repaints independently: the title bar, the bulb rows or
+# scene list, and the status line.
+_REGIONS = ("header", "rows", "footer")
+
+
+@dataclass(slots=True)
 class BulbInfo:
     """Container for wizlight instances and their state."""
 
@@ -75,13 +132,17 @@ class BulbInfo:
     rgb: Optional[RGBTuple] = None
     scene_id: Optional[int] = None
     last_error: Optional[str] = None
+    # (displayed fields, row text) this bulb was last drawn with.
+    _cached_line: Optional[Tuple[Tuple[Any, ...], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def label(self) -> str:
         return self.mac or self.ip
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BulbStateUpdate:
     """Result of a bulb operation, mirroring the Wiz state payload."""
 
@@ -94,19 +155,18 @@ class BulbStateUpdate:
 
     @classmethod
     def empty(cls) -> "BulbStateUpdate":
-        return cls()
+        """Return the shared update that carries no fields."""
+        return _EMPTY_UPDATE
 
     def apply(self, bulb: BulbInfo) -> None:
         if self.state is not None:
             bulb.state = bool(self.state)
         if self.brightness is not None:
             bulb.brightness = int(self.brightness)
-        if self.rgb is not None:
-            bulb.rgb = (
-                int(self.rgb[0]),
-                int(self.rgb[1]),
-                int(self.rgb[2]),
-            )
+        rgb = self.rgb
+        if rgb is not None:
+            red, green, blue = rgb
+            bulb.rgb = (int(red), int(green), int(blue))
         if self.scene_id is not None:
             bulb.scene_id = int(self.scene_id)
         if self.mac:
@@ -114,62 +174,205 @@ class BulbStateUpdate:
         bulb.last_error = self.error
 
 
+# Updates are frozen, so every no-op path can share one empty instance.
+_EMPTY_UPDATE = BulbStateUpdate()
+
+
+@dataclass
+class _PendingOperation:
+    """Book-keeping for a group action whose results are still arriving."""
+
+    targets: List[BulbInfo]
+    action: str
+    finish: Callable[[int, List[Tuple[BulbInfo, str]]], None]
+    remaining: int
+    success: int = 0
+    failures: List[Tuple[BulbInfo, str]] = field(default_factory=list)
+
+
 class WizAsyncController:
     """Manage wizlight coroutines on a dedicated asyncio loop."""
 
-    def __init__(self, broadcast_address: str, wait_time: float) -> None:
+    def __init__(
+        self,
+        broadcast_address: str,
+        wait_time: float,
+        per_bulb_timeout: float = float(TIMEOUT),
+    ) -> None:
         self.broadcast_address = broadcast_address
         self.wait_time = wait_time
-        self._loop = asyncio.new_event_loop()
+        # Upper bound for one bulb operation, so a slow bulb cannot stall a group.
+        # The default leaves room for every resend of wizlight's UDP backoff.
+        self.per_bulb_timeout = per_bulb_timeout
+        # Upper bound for each state fetch after a discovery broadcast.
+        self.fetch_timeout = max(1.0, wait_time / 2)
+        self._loop = _new_event_loop()
+        # Work handed over from the UI thread, a batch per wakeup; see _submit_many.
+        self._work: asyncio.Queue[List[Tuple[Coroutine[Any, Any, Any], Future[Any]]]] = (
+            asyncio.Queue()
+        )
+        self._worker: Optional[asyncio.Task[None]] = None
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._lights: Dict[str, wizlight] = {}
+        # ip -> broadcasts missed in a row, for known lights kept open meanwhile.
+        self._misses: Dict[str, int] = {}
+        self.discover_min_interval = 8.0
+        self._last_discovery_ts = 0.0
+        # The scan in flight, shared by every discover call until it is done.
+        self._discover_future: Optional[Future[List[BulbInfo]]] = None
+        # ip -> state fetch in flight on the loop, see async_refresh_state.
+        self._refreshing: Dict[str, asyncio.Task[BulbStateUpdate]] = {}
         self._thread.start()
 
     def _run_loop(self) -> None:
         asyncio.set_event_loop(self._loop)
+        self._worker = self._loop.create_task(self._consume())
         self._loop.run_forever()
 
     def _submit(self, coro: Coroutine[Any, Any, _T]) -> Future[_T]:
-        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return self._submit_many([coro])[0]
 
-    def discover(self) -> List[BulbInfo]:
-        future = self._submit(self._discover())
-        timeout = max(5.0, self.wait_time + 2.0)
-        return future.result(timeout=timeout)
+    def _submit_many(self, coros: List[Coroutine[Any, Any, _T]]) -> List[Future[_T]]:
+        """Hand coroutines to the loop thread with a single wakeup."""
+        items: List[Tuple[Coroutine[Any, Any, Any], Future[Any]]] = [
+            (coro, Future()) for coro in coros
+        ]
+        self._loop.call_soon_threadsafe(self._work.put_nowait, items)
+        return [future for _, future in items]
+
+    async def _consume(self) -> None:
+        while True:
+            for coro, future in await self._work.get():
+                if future.cancelled():
+                    coro.close()
+                    continue
+                task = self._loop.create_task(coro)
+                task.add_done_callback(partial(self._copy_result, future))
+                future.add_done_callback(partial(self._cancel_task, task))
+
+    @staticmethod
+    def _copy_result(future: Future[Any], task: asyncio.Task[Any]) -> None:
+        # Same hand-off as run_coroutine_threadsafe: the future stays pending
+        # until the task is done so callers can still cancel it.
+        if task.cancelled():
+            future.cancel()
+        if not future.set_running_or_notify_cancel():
+            return
+        exc = task.exception()
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(task.result())
 
+    def _cancel_task(self, task: asyncio.Task[Any], future: Future[Any]) -> None:
+        if future.cancelled():
+            self._loop.call_soon_threadsafe(task.cancel)
+
+    @staticmethod
+    def _await(future: Future[_T], timeout: float) -> _T:
+        """Block for future's result, cancelling its task if the wait is abandoned.
+
+        On a timeout or a Ctrl-C the coroutine would otherwise keep running on
+        the loop after the caller has given up on it.
+        """
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def discover(self, force: bool = False) -> List[BulbInfo]:
+        """Find bulbs and block until the scan is done; see discover_async."""
+        return self.discover_async(force).result(timeout=self._discover_timeout + 1.0)
+
+    def discover_async(self, force: bool = False) -> Future[List[BulbInfo]]:
+        """Start finding bulbs, reusing a recent scan unless force is set.
+
+        Within discover_min_interval of the last broadcast only the known
+        bulbs are refreshed, which skips the wait_time listening window.
+        While a scan is in flight every caller gets that same scan back.
+        """
+        future = self._discover_future
+        if future is not None and not future.done():
+            return future
+        recent = time.monotonic() - self._last_discovery_ts < self.discover_min_interval
+        scan = self._refresh_known() if recent and self._lights and not force else self._discover()
+        # One budget for both paths, so discover() never gives up on a scan first.
+        future = self._submit(asyncio.wait_for(scan, timeout=self._discover_timeout))
+        self._discover_future = future
+        future.add_done_callback(self._discover_done)
+        return future
+
+    def _discover_done(self, future: Future[List[BulbInfo]]) -> None:
+        # A newer scan may already have taken the slot; only clear our own.
+        if self._discover_future is future:
+            self._discover_future = None
+
+    @property
+    def _discover_timeout(self) -> float:
+        return max(5.0, self.wait_time + self.fetch_timeout + 2.0)
+
+    # The blocking discover and set_* / refresh_state calls are the controller's
+    # original public API, kept for scripts that drive bulbs without the UI.
+    # Each bulb call waits as long as one UI operation would.
     def set_power(self, bulb: BulbInfo, turn_on: bool) -> BulbStateUpdate:
-        future = self._submit(self._set_power(bulb.device, turn_on))
-        return future.result(timeout=10.0)
+        future = self._submit(self.async_set_power(bulb.device, turn_on))
+        return self._await(future, self.per_bulb_timeout)
 
     def set_scene(self, bulb: BulbInfo, scene_id: int) -> BulbStateUpdate:
-        future = self._submit(self._set_scene(bulb.device, scene_id))
-        return future.result(timeout=10.0)
+        future = self._submit(self.async_set_scene(bulb.device, scene_id))
+        return self._await(future, self.per_bulb_timeout)
 
     def set_brightness(self, bulb: BulbInfo, brightness: int) -> BulbStateUpdate:
-        future = self._submit(self._set_brightness(bulb.device, brightness))
-        return future.result(timeout=10.0)
+        future = self._submit(self.async_set_brightness(bulb.device, brightness))
+        return self._await(future, self.per_bulb_timeout)
 
     def set_rgb(self, bulb: BulbInfo, rgb: RGBTuple) -> BulbStateUpdate:
-        future = self._submit(self._set_rgb(bulb.device, rgb))
-        return future.result(timeout=10.0)
+        future = self._submit(self.async_set_rgb(bulb.device, rgb))
+        return self._await(future, self.per_bulb_timeout)
 
     def refresh_state(self, bulb: BulbInfo) -> BulbStateUpdate:
-        future = self._submit(self._refresh_state(bulb.device))
-        return future.result(timeout=10.0)
+        future = self._submit(self.async_refresh_state(bulb.device))
+        return self._await(future, self.per_bulb_timeout)
+
+    @staticmethod
+    def _deliver(
+        callback: Callable[[BulbStateUpdate], None], fut: Future[BulbStateUpdate]
+    ) -> None:
+        if fut.cancelled():
+            callback(BulbStateUpdate(error="cancelled"))
+        elif fut.exception() is not None:
+            callback(BulbStateUpdate(error=str(fut.exception())))
+        else:
+            callback(fut.result())
+
+    def apply_async(
+        self,
+        bulbs: List[BulbInfo],
+        make_coro: Callable[[wizlight], Coroutine[Any, Any, BulbStateUpdate]],
+        callback: Callable[[BulbInfo, BulbStateUpdate], None],
+    ) -> None:
+        """Start one operation per bulb; callback fires as each one finishes."""
+        futures = self._submit_many([self._wrap(make_coro(bulb.device)) for bulb in bulbs])
+        for bulb, future in zip(bulbs, futures):
+            future.add_done_callback(partial(self._deliver, partial(callback, bulb)))
 
     def shutdown(self) -> None:
         if self._loop.is_closed():
             return
         close_future = self._submit(self._shutdown_lights())
         try:
-            close_future.result(timeout=5.0)
+            close_future.result(timeout=1.0)
         except TimeoutError:
-            pass
+            _LOGGER.debug("Timed out closing lights, stopping the loop anyway")
         self._loop.call_soon_threadsafe(self._loop.stop)
-        self._thread.join(timeout=5.0)
+        # Nothing is left running on the loop, so it stops almost at once.
+        self._thread.join(timeout=1.0)
         if self._thread.is_alive():
+            _LOGGER.debug("Controller loop thread did not stop")
             return
-        self._loop.close()
+        with contextlib.suppress(RuntimeError):
+            self._loop.close()
 
     async def _discover(self) -> List[BulbInfo]:
         discovered = await discovery.find_wizlights(
@@ -177,49 +380,89 @@ class WizAsyncController:
         )
         found_ips = {entry.ip_address: entry for entry in discovered}
 
+        # UDP discovery is lossy: keep a missing light open for a few scans so
+        # a bulb that skipped one reply does not cost a new socket.
         for ip in list(self._lights):
-            if ip not in found_ips:
+            if ip in found_ips:
+                self._misses.pop(ip, None)
+                continue
+            misses = self._misses[ip] = self._misses.get(ip, 0) + 1
+            if misses >= _DISCOVERY_MAX_MISSES:
+                del self._misses[ip]
                 light = self._lights.pop(ip)
                 with contextlib.suppress(Exception):
                     await light.async_close()
 
-        bulbs: List[BulbInfo] = []
         for ip, entry in found_ips.items():
             light = self._lights.get(ip)
             if light is None:
-                light = wizlight(ip=entry.ip_address, mac=entry.mac_address)
-                self._lights[ip] = light
+                self._lights[ip] = wizlight(ip=entry.ip_address, mac=entry.mac_address)
             elif light.mac is None:
                 light.mac = entry.mac_address
 
-            update = BulbStateUpdate.empty()
-            try:
-                parser = await light.updateState()
-            except Exception as exc:  # pragma: no cover - network dependent
-                update = BulbStateUpdate(error=str(exc))
-                parser = None
-            else:
-                update = self._extract_details(parser)
-                if update.mac and light.mac is None:
-                    light.mac = update.mac
+        bulbs = await self._fetch_many(list(found_ips))
+        self._last_discovery_ts = time.monotonic()
+        return bulbs
 
-            bulbs.append(
-                BulbInfo(
+    async def _refresh_known(self) -> List[BulbInfo]:
+        return await self._fetch_many([ip for ip in self._lights if ip not in self._misses])
+
+    async def _fetch_many(self, ips: List[str]) -> List[BulbInfo]:
+        semaphore = asyncio.Semaphore(_DISCOVERY_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._fetch_one(ip, semaphore) for ip in ips),
+            return_exceptions=True,
+        )
+        bulbs: List[BulbInfo] = []
+        for ip, result in zip(ips, results):
+            if isinstance(result, BaseException):  # pragma: no cover - defensive
+                light = self._lights[ip]
+                result = BulbInfo(
                     device=light,
                     ip=ip,
                     mac=light.mac,
-                    state=update.state,
-                    brightness=update.brightness,
-                    rgb=update.rgb,
-                    scene_id=update.scene_id,
-                    last_error=update.error,
+                    state=None,
+                    last_error=str(result),
                 )
-            )
+            bulbs.append(result)
 
         bulbs.sort(key=lambda info: info.ip)
         return bulbs
 
-    async def _set_power(self, device: wizlight, turn_on: bool) -> BulbStateUpdate:
+    async def _fetch_one(self, ip: str, semaphore: asyncio.Semaphore) -> BulbInfo:
+        light = self._lights[ip]
+        try:
+            # The wait for a semaphore slot counts against the deadline too, so a
+            # wave of unresponsive bulbs cannot push the rest past the scan budget.
+            parser = await asyncio.wait_for(
+                self._fetch_state(light, semaphore), timeout=self.fetch_timeout
+            )
+        except asyncio.TimeoutError:
+            update = BulbStateUpdate(error="timeout")
+        except Exception as exc:  # pragma: no cover - network dependent
+            update = BulbStateUpdate(error=str(exc))
+        else:
+            update = self._extract_details(parser)
+            if update.mac and light.mac is None:
+                light.mac = update.mac
+
+        return BulbInfo(
+            device=light,
+            ip=ip,
+            mac=light.mac,
+            state=update.state,
+            brightness=update.brightness,
+            rgb=update.rgb,
+            scene_id=update.scene_id,
+            last_error=update.error,
+        )
+
+    @staticmethod
+    async def _fetch_state(light: wizlight, semaphore: asyncio.Semaphore) -> Optional[Any]:
+        async with semaphore:
+            return await light.updateState()
+
+    async def async_set_power(self, device: wizlight, turn_on: bool) -> BulbStateUpdate:
         try:
             if turn_on:
                 await device.turn_on()
@@ -228,21 +471,19 @@ class WizAsyncController:
             parser = await device.updateState()
         except Exception as exc:  # pragma: no cover - network dependent
             return BulbStateUpdate(error=str(exc))
-        details = self._extract_details(parser)
         if parser is None:
-            details.state = True if turn_on else False
-        details.error = None
-        return details
+            return BulbStateUpdate(state=turn_on)
+        return self._extract_details(parser)
 
-    async def _set_scene(self, device: wizlight, scene_id: int) -> BulbStateUpdate:
+    async def async_set_scene(self, device: wizlight, scene_id: int) -> BulbStateUpdate:
         builder = PilotBuilder(scene=scene_id, state=True)
         return await self._apply_builder(device, builder)
 
-    async def _set_brightness(self, device: wizlight, brightness: int) -> BulbStateUpdate:
+    async def async_set_brightness(self, device: wizlight, brightness: int) -> BulbStateUpdate:
         builder = PilotBuilder(brightness=brightness, state=True)
         return await self._apply_builder(device, builder)
 
-    async def _set_rgb(self, device: wizlight, rgb: RGBTuple) -> BulbStateUpdate:
+    async def async_set_rgb(self, device: wizlight, rgb: RGBTuple) -> BulbStateUpdate:
         builder = PilotBuilder(rgb=rgb, state=True)
         return await self._apply_builder(device, builder)
 
@@ -254,48 +495,64 @@ class WizAsyncController:
             parser = await device.updateState()
         except Exception as exc:  # pragma: no cover - network dependent
             return BulbStateUpdate(error=str(exc))
-        details = self._extract_details(parser)
-        details.error = None
-        return details
-
-    async def _refresh_state(self, device: wizlight) -> BulbStateUpdate:
+        return self._extract_details(parser)
+
+    async def async_refresh_state(self, device: wizlight) -> BulbStateUpdate:
+        """Fetch the bulb state, joining a fetch already in flight for its ip."""
+        task = self._refreshing.get(device.ip)
+        if task is None:
+            task = self._loop.create_task(self._refresh_once(device))
+            self._refreshing[device.ip] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(device.ip, None))
+        # Shielded, so a caller that times out does not cancel the shared fetch.
+        return await asyncio.shield(task)
+
+    async def _refresh_once(self, device: wizlight) -> BulbStateUpdate:
         try:
             parser = await device.updateState()
         except Exception as exc:  # pragma: no cover - network dependent
             return BulbStateUpdate(error=str(exc))
-        details = self._extract_details(parser)
-        details.error = None
-        return details
+        return self._extract_details(parser)
+
+    async def _wrap(self, coro: Coroutine[Any, Any, BulbStateUpdate]) -> BulbStateUpdate:
+        try:
+            return await asyncio.wait_for(coro, timeout=self.per_bulb_timeout)
+        except asyncio.TimeoutError:
+            return BulbStateUpdate(error="timeout")
+        except Exception as exc:  # pragma: no cover - network dependent
+            return BulbStateUpdate(error=str(exc))
 
     async def _shutdown_lights(self) -> None:
-        for light in list(self._lights.values()):
-            with contextlib.suppress(Exception):
-                await light.async_close()
+        await asyncio.gather(
+            *(light.async_close() for light in self._lights.values()),
+            return_exceptions=True,
+        )
         self._lights.clear()
-
-    @staticmethod
-    def _empty_result() -> BulbStateUpdate:
-        return BulbStateUpdate.empty()
+        self._misses.clear()
+        # Cancel the worker and whatever is still in flight (scans, bulb
+        # operations) so the loop stops with no pending tasks.
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
     @staticmethod
     def _extract_details(parser: Optional[Any]) -> BulbStateUpdate:
         if parser is None:
-            return BulbStateUpdate.empty()
+            return _EMPTY_UPDATE
         state = parser.get_state()
         brightness = parser.get_brightness()
         rgb_value: Optional[RGBTuple] = None
         rgb_raw = parser.get_rgb()
         if rgb_raw:
+            # get_rgb gives (None, None, None) when the bulb is not in RGB mode.
             try:
-                rgb_tuple = tuple(rgb_raw)
-            except TypeError:
-                rgb_tuple = None
-            if rgb_tuple and len(rgb_tuple) >= 3 and None not in rgb_tuple[:3]:
-                rgb_value = (
-                    int(rgb_tuple[0]),
-                    int(rgb_tuple[1]),
-                    int(rgb_tuple[2]),
-                )
+                r, g, b = rgb_raw[0], rgb_raw[1], rgb_raw[2]
+            except (TypeError, IndexError, KeyError):
+                pass
+            else:
+                if r is not None and g is not None and b is not None:
+                    rgb_value = (int(r), int(g), int(b))
         scene_id = parser.get_scene_id()
         mac = parser.get_mac()
         return BulbStateUpdate(
@@ -307,6 +564,14 @@ class WizAsyncController:
         )
 
 
+def _scene_window(total: int, index: int, available_rows: int) -> Tuple[int, int]:
+    """Return the [start, end) slice of the scene list that keeps index centred."""
+    start = 0
+    if total > available_rows:
+        start = min(max(0, index - available_rows // 2), total - available_rows)
+    return start, min(total, start + available_rows)
+
+
 class WizTUI:
     """Curses UI that lists bulbs and allows power control."""
 
@@ -314,31 +579,72 @@ class WizTUI:
         if curses is None:
             raise RuntimeError("curses module is not available")
         self._curses = curses
+        self._curses_error = curses.error
         self.stdscr = stdscr
         self.controller = controller
+        self._dirty: Set[str] = set(_REGIONS)
+        self._drawn_size: Tuple[int, int] = (0, 0)
+        self._last_render_key: Optional[Tuple[Any, ...]] = None
+        # Bumped whenever a shown bulb's fields change, see _bump_bulbs.
+        self._bulbs_version = 0
+        # y -> (x, width, text, attr) last written there, see _safe_add.
+        self._line_cache: Dict[int, Tuple[int, int, str, int]] = {}
         self.bulbs: List[BulbInfo] = []
         self.selected_index = 0
         self.status_message = "Press r to scan for bulbs"
         self.show_scene_list = False
         self.scene_list_index = 0
         self.group_mode = False
+        self._pending: List[_PendingOperation] = []
+        # Work posted from the controller loop to run on the UI thread.
+        self._results: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        self._scan: Optional[Future[List[BulbInfo]]] = None
+        self._footer_attr_cache: Tuple[Optional[str], int] = (None, 0)
+        # (state, row parity) -> attribute; at most six entries.
+        self._row_attr_cache: Dict[Tuple[Optional[bool], int], int] = {}
         self._init_default_attrs()
         self._keymap: Dict[int, Callable[[], None]] = {}
+        # Dense copy of _keymap indexed by key code for the per-keypress lookup.
+        self._keymap_arr: List[Optional[Callable[[], None]]] = []
+        # Keys that act on the scene list while it is shown, ahead of _keymap.
+        self._scene_keymap: Dict[int, Callable[[], None]] = {}
         self._init_key_bindings()
 
+    @property
+    def status_message(self) -> str:
+        return self._status_message
+
+    @status_message.setter
+    def status_message(self, message: str) -> None:
+        self._status_message = message
+        self._dirty.add("footer")
+
+    def _bump_bulbs(self) -> None:
+        """Record that fields of a displayed bulb changed."""
+        self._bulbs_version += 1
+
+    def _invalidate(self, *regions: str) -> None:
+        """Mark screen regions for repaint on the next draw(); all of them by default."""
+        self._dirty.update(regions or _REGIONS)
+
     def _init_default_attrs(self) -> None:
-        dim = getattr(self._curses, "A_DIM", self._curses.A_NORMAL)
-        self.attr_header = self._curses.A_REVERSE | self._curses.A_BOLD
-        self.attr_footer = self._curses.A_BOLD
-        self.attr_footer_info = self._curses.A_BOLD
-        self.attr_footer_error = self._curses.A_BOLD | self._curses.A_REVERSE
-        self.attr_row = self._curses.A_NORMAL
+        # Resolve the curses attribute constants once for both attribute setups.
+        self._A_NORMAL = self._curses.A_NORMAL
+        self._A_BOLD = self._curses.A_BOLD
+        self._A_REVERSE = self._curses.A_REVERSE
+        self._A_DIM = getattr(self._curses, "A_DIM", self._A_NORMAL)
+        bold, reverse, dim = self._A_BOLD, self._A_REVERSE, self._A_DIM
+        self.attr_header = reverse | bold
+        self.attr_footer = bold
+        self.attr_footer_info = bold
+        self.attr_footer_error = bold | reverse
+        self.attr_row = self._A_NORMAL
         self.attr_row_alt = dim
-        self.attr_row_on = self._curses.A_BOLD
+        self.attr_row_on = bold
         self.attr_row_off = dim
-        self.attr_row_selected = self._curses.A_REVERSE | self._curses.A_BOLD
-        self.attr_scene_row = self._curses.A_NORMAL
-        self.attr_scene_selected = self._curses.A_REVERSE | self._curses.A_BOLD
+        self.attr_row_selected = reverse | bold
+        self.attr_scene_row = self._A_NORMAL
+        self.attr_scene_selected = reverse | bold
         self.attr_scene_hint = dim
 
     def _init_colors(self) -> None:
@@ -346,63 +652,74 @@ class WizTUI:
             return
         try:
             self._curses.start_color()
-        except self._curses.error:
+        except self._curses_error:
             return
-        with contextlib.suppress(self._curses.error):
+        with contextlib.suppress(self._curses_error):
             self._curses.use_default_colors()
 
         def init_pair(idx: int, fg: int, bg: int = -1) -> int:
             try:
                 self._curses.init_pair(idx, fg, bg)
                 return self._curses.color_pair(idx)
-            except self._curses.error:
+            except self._curses_error:
                 return 0
 
+        bold, dim = self._A_BOLD, self._A_DIM
         header = init_pair(1, self._curses.COLOR_BLACK, self._curses.COLOR_CYAN)
         if header:
-            self.attr_header = header | self._curses.A_BOLD
+            self.attr_header = header | bold
 
         footer = init_pair(2, self._curses.COLOR_WHITE, self._curses.COLOR_BLUE)
         if footer:
-            self.attr_footer = footer | self._curses.A_BOLD
+            self.attr_footer = footer | bold
 
         info = init_pair(3, self._curses.COLOR_GREEN, -1)
         if info:
-            self.attr_footer_info = info | self._curses.A_BOLD
+            self.attr_footer_info = info | bold
 
         error = init_pair(4, self._curses.COLOR_WHITE, self._curses.COLOR_RED)
         if error:
-            self.attr_footer_error = error | self._curses.A_BOLD
+            self.attr_footer_error = error | bold
 
         row = init_pair(5, self._curses.COLOR_WHITE, -1)
         alt = init_pair(6, self._curses.COLOR_CYAN, -1)
         selected = init_pair(7, self._curses.COLOR_BLACK, self._curses.COLOR_YELLOW)
-        dim = getattr(self._curses, "A_DIM", self._curses.A_NORMAL)
         if row:
             self.attr_row = row
         if alt:
             self.attr_row_alt = alt | dim
         if selected:
-            self.attr_row_selected = selected | self._curses.A_BOLD
-            self.attr_scene_selected = selected | self._curses.A_BOLD
-            self.attr_row_on = self._curses.A_BOLD
+            self.attr_row_selected = selected | bold
+            self.attr_scene_selected = selected | bold
+            self.attr_row_on = bold
             self.attr_row_off = dim
 
         scene_row = init_pair(8, self._curses.COLOR_CYAN, -1)
         if scene_row:
-            self.attr_scene_row = scene_row | self._curses.A_BOLD
+            self.attr_scene_row = scene_row | bold
         hint = init_pair(9, self._curses.COLOR_MAGENTA, -1)
         if hint:
             self.attr_scene_hint = hint | dim
 
+        # Attributes changed under the caches, so drop them and repaint.
+        self._footer_attr_cache = (None, 0)
+        self._row_attr_cache.clear()
+        self._invalidate()
+
     def _init_key_bindings(self) -> None:
-        def bind(keys: Tuple[int, ...], handler: Callable[[], None]) -> None:
+        def bind(
+            keys: Tuple[int, ...],
+            handler: Callable[[], None],
+            keymap: Optional[Dict[int, Callable[[], None]]] = None,
+        ) -> None:
+            target = self._keymap if keymap is None else keymap
             for key in keys:
-                self._keymap[key] = handler
+                target[key] = handler
 
         bind((self._curses.KEY_UP, ord("k")), lambda: self._move_selection(-1))
         bind((self._curses.KEY_DOWN, ord("j")), lambda: self._move_selection(1))
-        bind((ord("r"), ord("R")), self.refresh_bulbs)
+        bind((ord("r"),), self.refresh_bulbs)
+        bind((ord("R"),), partial(self.refresh_bulbs, force=True))
         bind((ord(" "), ord("t"), ord("T")), self.toggle_selected)
         bind((ord("o"), ord("O")), partial(self.set_selected, True))
         bind((ord("f"), ord("F")), partial(self.set_selected, False))
@@ -413,6 +730,20 @@ class WizTUI:
         bind((ord("g"), ord("G")), self.toggle_group_mode)
         bind((ord("l"), ord("L")), self.toggle_scene_list)
 
+        scene_keys = self._scene_keymap
+        bind((ord("l"), ord("L")), self.toggle_scene_list, scene_keys)
+        bind((self._curses.KEY_UP, ord("k")), partial(self._move_scene_cursor, -1), scene_keys)
+        bind((self._curses.KEY_DOWN, ord("j")), partial(self._move_scene_cursor, 1), scene_keys)
+        bind(
+            (self._curses.KEY_ENTER, ord("\n"), ord("\r"), ord("n"), ord("N"), ord(" ")),
+            self._apply_scene_from_list,
+            scene_keys,
+        )
+
+        self._keymap_arr = [None] * (max(self._keymap) + 1)
+        for key, handler in self._keymap.items():
+            self._keymap_arr[key] = handler
+
     def _handle_key(self, key: int) -> bool:
         if key == self._curses.ERR:
             return True
@@ -420,7 +751,7 @@ class WizTUI:
             return False
         if self.show_scene_list and self._handle_scene_list_key(key):
             return True
-        handler = self._keymap.get(key)
+        handler = self._keymap_arr[key] if 0 <= key < len(self._keymap_arr) else None
         if handler:
             handler()
         return True
@@ -428,34 +759,49 @@ class WizTUI:
     def run(self) -> None:
         try:
             self._curses.curs_set(0)
-        except self._curses.error:  # pragma: no cover - terminal dependent
+        except self._curses_error:  # pragma: no cover - terminal dependent
             pass
-        self.stdscr.nodelay(False)
+        # Wake up periodically so results from the controller loop get drawn.
+        self.stdscr.timeout(_RESULT_POLL_MS)
         self.stdscr.keypad(True)
         self._init_colors()
         self.refresh_bulbs(initial=True)
 
         while True:
+            self._drain_results()
             self.draw()
             key = self.stdscr.getch()
             if not self._handle_key(key):
                 break
 
-    def refresh_bulbs(self, initial: bool = False) -> None:
+    def refresh_bulbs(self, initial: bool = False, force: bool = False) -> None:
+        if self._scan is not None:
+            self.status_message = "Scan already in progress..."
+            return
         self.status_message = "Scanning for bulbs..."
         self.draw()
+        # The scan runs on the controller loop; keys keep working until it reports.
+        self._scan = scan = self.controller.discover_async(force=force)
+        scan.add_done_callback(
+            lambda fut: self._results.put(partial(self._finish_scan, initial, fut))
+        )
+
+    def _finish_scan(self, initial: bool, scan: Future[List[BulbInfo]]) -> None:
+        self._scan = None
         try:
-            self.bulbs = self.controller.discover()
+            self.bulbs = scan.result()
         except Exception as exc:  # pragma: no cover - network dependent
             self.bulbs = []
             self.selected_index = 0
-            self.status_message = f"Discovery failed: {exc}"
-            self.draw()
+            self._invalidate("rows")
+            self.status_message = f"Discovery failed: {exc or type(exc).__name__}"
             return
         if self.selected_index >= len(self.bulbs):
             self.selected_index = max(len(self.bulbs) - 1, 0)
+        self._invalidate("rows")
         if not self.bulbs:
             self.group_mode = False
+            self._invalidate("header")
             self.status_message = "No bulbs found. Press r to retry."
         else:
             count = len(self.bulbs)
@@ -465,55 +811,36 @@ class WizTUI:
                 self.status_message = self._scene_list_status()
             else:
                 self.status_message = base_msg + ' Press l to view scenes.'
-        self.draw()
 
     def toggle_selected(self) -> None:
         targets = self._targets()
         if not targets:
             return
         known_states = [state for state in (bulb.state for bulb in targets) if state is not None]
-        desired = False if known_states and all(known_states) else True
-        verb = "on" if desired else "off"
-        self.status_message = f"Turning {verb} {self._target_label(targets)}..."
-        self.draw()
-        success, failures = self._apply_to_targets(
-            targets, lambda bulb: self.controller.set_power(bulb, desired)
-        )
-        if failures:
-            self.status_message = self._format_failure_summary(
-                f"Turned {verb}", success, len(targets), failures
-            )
-        else:
-            if len(targets) == 1:
-                bulb = targets[0]
-                status = "on" if bulb.state else "off"
-                self.status_message = f"{bulb.label} is {status}."
-            else:
-                self.status_message = f"Turned {verb} {success} bulbs."
-        self.draw()
+        self._power_targets(targets, False if known_states and all(known_states) else True)
 
     def set_selected(self, turn_on: bool) -> None:
         targets = self._targets()
         if not targets:
             return
+        self._power_targets(targets, turn_on)
+
+    def _power_targets(self, targets: List[BulbInfo], turn_on: bool) -> None:
         verb = "on" if turn_on else "off"
         self.status_message = f"Turning {verb} {self._target_label(targets)}..."
         self.draw()
-        success, failures = self._apply_to_targets(
-            targets, lambda bulb: self.controller.set_power(bulb, turn_on)
+        self._apply_to_targets(
+            targets,
+            f"Turning {verb}",
+            lambda device: self.controller.async_set_power(device, turn_on),
+            partial(
+                self._finalize,
+                targets,
+                f"Turned {verb}",
+                lambda bulb: f"{bulb.label} is {'on' if bulb.state else 'off'}.",
+                lambda success: f"Turned {verb} {success} bulbs.",
+            ),
         )
-        if failures:
-            self.status_message = self._format_failure_summary(
-                f"Turned {verb}", success, len(targets), failures
-            )
-        else:
-            if len(targets) == 1:
-                bulb = targets[0]
-                status = "on" if bulb.state else "off"
-                self.status_message = f"{bulb.label} is {status}."
-            else:
-                self.status_message = f"Turned {verb} {success} bulbs."
-        self.draw()
 
     def refresh_selected(self) -> None:
         targets = self._targets()
@@ -521,20 +848,18 @@ class WizTUI:
             return
         self.status_message = f"Refreshing {self._target_label(targets)}..."
         self.draw()
-        success, failures = self._apply_to_targets(
-            targets, lambda bulb: self.controller.refresh_state(bulb)
+        self._apply_to_targets(
+            targets,
+            "Refreshing",
+            self.controller.async_refresh_state,
+            partial(
+                self._finalize,
+                targets,
+                "Refreshed",
+                lambda bulb: f"{bulb.label}: {self._format_status_summary(bulb)}",
+                lambda success: f"Refreshed {success} bulbs.",
+            ),
         )
-        if failures:
-            self.status_message = self._format_failure_summary(
-                "Refreshed", success, len(targets), failures
-            )
-        else:
-            if len(targets) == 1:
-                bulb = targets[0]
-                self.status_message = f"{bulb.label}: {self._format_status_summary(bulb)}"
-            else:
-                self.status_message = f"Refreshed {success} bulbs."
-        self.draw()
 
     def adjust_brightness(self) -> None:
         targets = self._targets()
@@ -543,34 +868,29 @@ class WizTUI:
         response = self._prompt("Brightness 0-255 (blank to cancel): ")
         if response is None:
             self.status_message = "Brightness update cancelled."
-            self.draw()
             return
         try:
             value = int(response)
         except ValueError:
             self.status_message = "Brightness must be an integer between 0 and 255."
-            self.draw()
             return
         if not 0 <= value <= 255:
             self.status_message = "Brightness must be between 0 and 255."
-            self.draw()
             return
         self.status_message = f"Setting brightness {value} for {self._target_label(targets)}..."
         self.draw()
-        success, failures = self._apply_to_targets(
-            targets, lambda bulb: self.controller.set_brightness(bulb, value)
+        self._apply_to_targets(
+            targets,
+            f"Setting brightness {value}",
+            lambda device: self.controller.async_set_brightness(device, value),
+            partial(
+                self._finalize,
+                targets,
+                "Brightness set on",
+                lambda bulb: f"{bulb.label} brightness {bulb.brightness}.",
+                lambda success: f"Set brightness {value} on {success} bulbs.",
+            ),
         )
-        if failures:
-            self.status_message = self._format_failure_summary(
-                "Brightness set on", success, len(targets), failures
-            )
-        else:
-            if len(targets) == 1:
-                bulb = targets[0]
-                self.status_message = f"{bulb.label} brightness {bulb.brightness}."
-            else:
-                self.status_message = f"Set brightness {value} on {success} bulbs."
-        self.draw()
 
     def set_rgb_color(self) -> None:
         targets = self._targets()
@@ -579,30 +899,26 @@ class WizTUI:
         response = self._prompt("RGB (e.g. 255,128,0 or #FF8000): ")
         if response is None:
             self.status_message = "RGB update cancelled."
-            self.draw()
             return
         try:
             rgb = self._parse_rgb_input(response)
         except ValueError as exc:
             self.status_message = str(exc)
-            self.draw()
             return
         self.status_message = f"Setting RGB {rgb} for {self._target_label(targets)}..."
         self.draw()
-        success, failures = self._apply_to_targets(
-            targets, lambda bulb: self.controller.set_rgb(bulb, rgb)
+        self._apply_to_targets(
+            targets,
+            f"Setting RGB {rgb}",
+            lambda device: self.controller.async_set_rgb(device, rgb),
+            partial(
+                self._finalize,
+                targets,
+                "RGB set on",
+                lambda bulb: f"{bulb.label} color {bulb.rgb}.",
+                lambda success: f"Set RGB {rgb} on {success} bulbs.",
+            ),
         )
-        if failures:
-            self.status_message = self._format_failure_summary(
-                "RGB set on", success, len(targets), failures
-            )
-        else:
-            if len(targets) == 1:
-                bulb = targets[0]
-                self.status_message = f"{bulb.label} color {bulb.rgb}."
-            else:
-                self.status_message = f"Set RGB {rgb} on {success} bulbs."
-        self.draw()
 
     def apply_scene(self) -> None:
         targets = self._targets()
@@ -611,13 +927,11 @@ class WizTUI:
         response = self._prompt("Scene id or name (blank to cancel): ")
         if response is None:
             self.status_message = "Scene change cancelled."
-            self.draw()
             return
         try:
             scene_id = self._resolve_scene(response)
         except ValueError as exc:
             self.status_message = str(exc)
-            self.draw()
             return
         self._apply_scene_to_selected(scene_id)
 
@@ -627,94 +941,133 @@ class WizTUI:
             return
         self.status_message = f"Applying scene {scene_id} to {self._target_label(targets)}..."
         self.draw()
-        success, failures = self._apply_to_targets(
-            targets, lambda bulb: self.controller.set_scene(bulb, scene_id)
-        )
         scene_name = SCENES.get(scene_id)
+        scene = f"{scene_id}:{scene_name}" if scene_name else f"{scene_id}"
+        self._apply_to_targets(
+            targets,
+            f"Applying scene {scene_id}",
+            lambda device: self.controller.async_set_scene(device, scene_id),
+            partial(
+                self._finalize,
+                targets,
+                f"Scene {scene}",
+                lambda bulb: f"{bulb.label} scene {scene}.",
+                lambda success: f"Applied scene {scene} to {success} bulbs.",
+            ),
+        )
+
+    def _finalize(
+        self,
+        targets: List[BulbInfo],
+        action: str,
+        single: Callable[[BulbInfo], str],
+        multi: Callable[[int], str],
+        success: int,
+        failures: List[Tuple[BulbInfo, str]],
+    ) -> None:
+        """Set the closing status of an action once every target has answered."""
         if failures:
-            label = f"Scene {scene_id}" if not scene_name else f"Scene {scene_id}:{scene_name}"
-            self.status_message = self._format_failure_summary(label, success, len(targets), failures)
+            self.status_message = self._format_failure_summary(action, success, len(targets), failures)
+        elif len(targets) == 1:
+            self.status_message = single(targets[0])
         else:
-            if len(targets) == 1:
-                bulb = targets[0]
-                if scene_name:
-                    self.status_message = f"{bulb.label} scene {scene_id}:{scene_name}."
-                else:
-                    self.status_message = f"{bulb.label} scene {scene_id}."
-            else:
-                if scene_name:
-                    self.status_message = f"Applied scene {scene_id}:{scene_name} to {success} bulbs."
-                else:
-                    self.status_message = f"Applied scene {scene_id} to {success} bulbs."
-        self.draw()
+            self.status_message = multi(success)
 
     def _move_selection(self, delta: int) -> None:
+        self._invalidate("rows")
         if not self.bulbs:
             self.selected_index = 0
             return
         self.selected_index = (self.selected_index + delta) % len(self.bulbs)
 
     def draw(self) -> None:
-        self.stdscr.erase()
+        """Repaint the regions invalidated since the last draw and refresh."""
         height, width = self.stdscr.getmaxyx()
-        header = " pywizlight TUI"
-        if self.group_mode:
-            header += " [GROUP]"
-        if self.show_scene_list:
-            header += " [SCENES]"
-        header += "  r:scan space:toggle o:on f:off b:bri c:rgb n:scene g:group l:list enter:apply s:status q:quit "
+        if (height, width) != self._drawn_size:
+            # After a resize the terminal contents are unknown: start blank.
+            self._drawn_size = (height, width)
+            self.stdscr.erase()
+            self._line_cache.clear()
+            self._invalidate()
+        # Catch view state changed without an _invalidate() call; when nothing
+        # differs from the last frame the draw is skipped entirely. The bulb list
+        # itself is held (not its id) so a recycled id cannot match a new list.
+        render_key = (
+            self.selected_index,
+            self.show_scene_list,
+            self.scene_list_index,
+            self.group_mode,
+            self.bulbs,
+            len(self.bulbs),
+            self._bulbs_version,
+        )
+        if render_key != self._last_render_key:
+            self._last_render_key = render_key
+            self._invalidate("header", "rows")
+        if not self._dirty:
+            return
+        if "header" in self._dirty:
+            self._draw_header(width)
+        if "rows" in self._dirty:
+            self._draw_rows(height, width)
+        self._draw_footer(height, width)
+        self._dirty.clear()
+        # Stage the frame and push it to the terminal in one write.
+        try:
+            self.stdscr.noutrefresh()
+            self._curses.doupdate()
+        except self._curses_error:  # pragma: no cover - terminal dependent
+            pass
+
+    def _draw_header(self, width: int) -> None:
+        header = _HEADERS[(self.group_mode, self.show_scene_list)]
         self._safe_add(0, 0, header, width, self.attr_header)
+
+    def _draw_rows(self, height: int, width: int) -> None:
         if self.show_scene_list:
-            self._draw_scene_list(height, width)
-            return
-        for idx, bulb in enumerate(self.bulbs):
-            y = idx + 2
-            if y >= height - 1:
-                break
-            attr = self.attr_row_selected if idx == self.selected_index else self._row_attr(bulb, idx)
-            line = self._format_bulb_line(bulb)
-            self._safe_add(y, 0, line, width, attr)
+            row = self._draw_scene_list(height, width)
+        else:
+            self._safe_add(1, 0, "", width, self._A_NORMAL)
+            row = 2
+            for idx, bulb in enumerate(self.bulbs):
+                if row >= height - 1:
+                    break
+                attr = self.attr_row_selected if idx == self.selected_index else self._row_attr(bulb, idx)
+                self._safe_add(row, 0, self._bulb_line(bulb), width, attr)
+                row += 1
+        # The screen is not erased between frames, so blank what is no longer used;
+        # _safe_add skips lines that are already blank.
+        for y in range(row, height - 1):
+            self._safe_add(y, 0, "", width, self._A_NORMAL)
+
+    def _draw_footer(self, height: int, width: int) -> None:
         footer = self.status_message
+        if self.show_scene_list:
+            footer = footer or "Scene list"
         self._safe_add(height - 1, 0, footer, width, self._footer_attr())
-        try:
-            self.stdscr.refresh()
-        except self._curses.error:  # pragma: no cover - terminal dependent
-            pass
 
     def _handle_scene_list_key(self, key: int) -> bool:
-        if key in (ord("l"), ord("L")):
-            self.toggle_scene_list()
-            return True
+        handler = self._scene_keymap.get(key)
+        if handler is None:
+            return False
+        handler()
+        return True
+
+    def _move_scene_cursor(self, delta: int) -> None:
         scene_items = self._scene_items()
         if not scene_items:
-            return False
-        if key in (self._curses.KEY_UP, ord("k")):
-            self.scene_list_index = (self.scene_list_index - 1) % len(scene_items)
-            self.status_message = self._scene_list_status()
-            return True
-        if key in (self._curses.KEY_DOWN, ord("j")):
-            self.scene_list_index = (self.scene_list_index + 1) % len(scene_items)
-            self.status_message = self._scene_list_status()
-            return True
-        if key in (
-            self._curses.KEY_ENTER,
-            ord("\n"),
-            ord("\r"),
-            ord("n"),
-            ord("N"),
-            ord(" "),
-        ):
-            self._apply_scene_from_list()
-            return True
-        return False
+            return
+        self.scene_list_index = (self.scene_list_index + delta) % len(scene_items)
+        self._invalidate("rows")
+        self.status_message = self._scene_list_status()
 
     def toggle_group_mode(self) -> None:
         if not self.bulbs:
             self.group_mode = False
             self.status_message = "No bulbs available. Press r to rescan."
-            self.draw()
             return
         self.group_mode = not self.group_mode
+        self._invalidate("header", "rows")
         state = "enabled" if self.group_mode else "disabled"
         current_index = min(self.selected_index, len(self.bulbs) - 1)
         self.selected_index = current_index
@@ -723,10 +1076,10 @@ class WizTUI:
         else:
             label = self._target_label([self.bulbs[self.selected_index]])
         self.status_message = f"Group mode {state}. Target: {label}."
-        self.draw()
 
     def toggle_scene_list(self) -> None:
         self.show_scene_list = not getattr(self, "show_scene_list", False)
+        self._invalidate("header", "rows")
         scene_items = self._scene_items()
         if self.show_scene_list:
             if scene_items:
@@ -737,40 +1090,34 @@ class WizTUI:
         else:
             self.status_message = "Scene list hidden."
 
-    def _draw_scene_list(self, height: int, width: int) -> None:
+    def _draw_scene_list(self, height: int, width: int) -> int:
+        """Draw the visible scenes from row 1 and return the first unused row."""
         scene_items = self._scene_items()
         available_rows = max(0, height - 2)
         if available_rows <= 0:
-            return
+            return 1
         total = len(scene_items)
         if total == 0:
             dim_attr = self.attr_scene_hint
             self._safe_add(1, 0, "No scenes available.", width, dim_attr)
-            footer = self.status_message or "Scene list"
-            self._safe_add(height - 1, 0, footer, width, self._footer_attr())
-            return
+            return 2
         self.scene_list_index = max(0, min(self.scene_list_index, total - 1))
-        start = 0
-        if total > available_rows:
-            start = min(max(0, self.scene_list_index - available_rows // 2), total - available_rows)
-        end = min(total, start + available_rows)
+        start, end = _scene_window(total, self.scene_list_index, available_rows)
         row = 1
         dim_attr = self.attr_scene_hint
         if start > 0 and row < height - 1:
             self._safe_add(row, 0, "... earlier scenes ...", width, dim_attr)
             row += 1
-        for idx in range(start, end):
+        for idx, line in enumerate(_SCENE_LABELS[start:end], start):
             if row >= height - 1:
                 break
-            scene_id, name = scene_items[idx]
             attr = self.attr_scene_selected if idx == self.scene_list_index else self.attr_scene_row
-            line = f"{scene_id:>4}: {name}"
             self._safe_add(row, 0, line, width, attr)
             row += 1
         if end < total and row < height - 1:
             self._safe_add(row, 0, "... more scenes ...", width, dim_attr)
-        footer = self.status_message or "Scene list"
-        self._safe_add(height - 1, 0, footer, width, self._footer_attr())
+            row += 1
+        return row
 
     def _scene_list_status(self) -> str:
         scene_items = self._scene_items()
@@ -785,26 +1132,38 @@ class WizTUI:
         scene_items = self._scene_items()
         if not scene_items:
             self.status_message = "Scene list (empty)."
-            self.draw()
             return
         scene_id, _ = scene_items[self.scene_list_index]
         self._apply_scene_to_selected(scene_id)
 
     def _row_attr(self, bulb: BulbInfo, index: int) -> int:
-        base = self.attr_row_alt if index % 2 else self.attr_row
-        if bulb.state is True:
-            base |= self.attr_row_on
-        elif bulb.state is False:
-            base |= self.attr_row_off
-        return base
+        key = (bulb.state, index & 1)
+        attr = self._row_attr_cache.get(key)
+        if attr is None:
+            attr = self.attr_row_alt if index % 2 else self.attr_row
+            if bulb.state is True:
+                attr |= self.attr_row_on
+            elif bulb.state is False:
+                attr |= self.attr_row_off
+            self._row_attr_cache[key] = attr
+        return attr
 
     def _footer_attr(self) -> int:
-        message = (self.status_message or "").lower()
-        if any(word in message for word in ("error", "fail", "timeout", "invalid")):
-            return self.attr_footer_error
-        if any(word in message for word in ("scene list", "brightness", "color", "rgb", "scene", "group")):
-            return self.attr_footer_info
-        return self.attr_footer
+        message = self.status_message
+        cached_message, attr = self._footer_attr_cache
+        # The cache holds a reference to the message, so the identity check cannot
+        # be fooled by a recycled id; redraws of an unchanged status skip the regexes.
+        if message is cached_message:
+            return attr
+        text = message or ""
+        if _FOOTER_ERROR_RE.search(text):
+            attr = self.attr_footer_error
+        elif _FOOTER_INFO_RE.search(text):
+            attr = self.attr_footer_info
+        else:
+            attr = self.attr_footer
+        self._footer_attr_cache = (message, attr)
+        return attr
 
     def _targets(self) -> List[BulbInfo]:
         if not self._has_selection():
@@ -821,22 +1180,51 @@ class WizTUI:
     def _apply_to_targets(
         self,
         targets: List[BulbInfo],
-        executor: Callable[[BulbInfo], BulbStateUpdate],
-    ) -> Tuple[int, List[Tuple[BulbInfo, str]]]:
-        success = 0
-        failures: List[Tuple[BulbInfo, str]] = []
-        for bulb in targets:
+        action: str,
+        make_coro: Callable[[wizlight], Coroutine[Any, Any, BulbStateUpdate]],
+        finish: Callable[[int, List[Tuple[BulbInfo, str]]], None],
+    ) -> None:
+        """Start make_coro for every target; finish runs once all have reported."""
+        operation = _PendingOperation(targets, action, finish, remaining=len(targets))
+        self._pending.append(operation)
+        try:
+            self.controller.apply_async(
+                targets,
+                make_coro,
+                lambda bulb, result: self._results.put(
+                    partial(self._apply_result, operation, bulb, result)
+                ),
+            )
+        except Exception as exc:  # pragma: no cover - loop already closed
+            self._pending.remove(operation)
+            finish(0, [(bulb, str(exc)) for bulb in targets])
+
+    def _drain_results(self) -> None:
+        """Run the work posted by the controller loop, in arrival order."""
+        while True:
             try:
-                result = executor(bulb)
-            except Exception as exc:  # pragma: no cover - network dependent
-                failures.append((bulb, str(exc)))
-                continue
-            result.apply(bulb)
-            if result.error:
-                failures.append((bulb, str(result.error)))
-            else:
-                success += 1
-        return success, failures
+                work = self._results.get_nowait()
+            except queue.Empty:
+                return
+            work()
+
+    def _apply_result(
+        self, operation: _PendingOperation, bulb: BulbInfo, result: BulbStateUpdate
+    ) -> None:
+        """Record one bulb's result and update the footer with the progress."""
+        result.apply(bulb)
+        self._bump_bulbs()
+        if result.error:
+            operation.failures.append((bulb, str(result.error)))
+        else:
+            operation.success += 1
+        operation.remaining -= 1
+        if operation.remaining:
+            done = len(operation.targets) - operation.remaining
+            self.status_message = f"{operation.action}: {done}/{len(operation.targets)} updated..."
+            return
+        self._pending.remove(operation)
+        operation.finish(operation.success, operation.failures)
 
     def _format_failure_summary(
         self,
@@ -846,69 +1234,98 @@ class WizTUI:
         failures: List[Tuple[BulbInfo, str]],
     ) -> str:
         detail = "; ".join(f"{bulb.label}: {err}" for bulb, err in failures[:2])
-        if len(failures) > 2:
-            detail += "; ..."
-        return f"{action} {success}/{total} bulbs (failures: {detail})"
-
-    def _scene_items(self) -> List[Tuple[int, str]]:
-        return sorted(SCENES.items())
-
-    def _safe_add(self, y: int, x: int, text: str, width: int, attr: int) -> None:
-        if y < 0 or y >= self.stdscr.getmaxyx()[0] or width <= 0:
+        more = "; ..." if len(failures) > 2 else ""
+        return f"{action} {success}/{total} bulbs (failures: {detail}{more})"
+
+    def _scene_items(self) -> Tuple[Tuple[int, str], ...]:
+        return _SCENE_ITEMS
+
+    def _safe_add(
+        self, y: int, x: int, text: str, width: int, attr: int, max_y: Optional[int] = None
+    ) -> None:
+        """Write text padded to width at (y, x) unless y is off screen.
+
+        max_y defaults to the height measured by the current draw(); callers
+        outside draw() pass the height they measured.
+        """
+        if max_y is None:
+            max_y = self._drawn_size[0]
+        if y < 0 or y >= max_y or width <= 0:
+            return
+        # Skip the write when the line already shows exactly this content.
+        drawn = (x, width, text, attr)
+        if self._line_cache.get(y) == drawn:
             return
+        self._line_cache[y] = drawn
+        # Writing text into the bottom-right cell moves the cursor off the window
+        # and raises; stop one short there and let hline, which leaves the
+        # cursor alone, fill that cell.
+        text_len = min(len(text), width - 1 if y == max_y - 1 else width)
+        pad = width - text_len
         try:
-            self.stdscr.addnstr(y, x, text.ljust(width), width, attr)
-        except self._curses.error:  # pragma: no cover - terminal dependent
+            if text_len:
+                self.stdscr.addnstr(y, x, text, text_len, attr)
+            if pad:
+                # Pad to width so cells left over from a longer previous line are cleared.
+                self.stdscr.hline(y, x + text_len, _SPACE | attr, pad)
+        except self._curses_error:  # pragma: no cover - terminal dependent
             pass
 
+    def _bulb_line(self, bulb: BulbInfo) -> str:
+        """Return the row text for bulb, reformatting only when a shown field changed."""
+        key = (bulb.state, bulb.brightness, bulb.rgb, bulb.scene_id, bulb.last_error, bulb.mac, bulb.ip)
+        cached = bulb._cached_line
+        if cached is None or cached[0] != key:
+            cached = bulb._cached_line = (key, self._format_bulb_line(bulb))
+        return cached[1]
+
     def _format_bulb_line(self, bulb: BulbInfo) -> str:
-        if bulb.state is True:
-            state = "ON "
-        elif bulb.state is False:
-            state = "OFF"
-        else:
-            state = "???"
-        parts = [f"[{state}] {bulb.label} ({bulb.ip})"]
+        state = _STATE_LABEL.get(bulb.state, "???")
+        line = f"[{state}] {bulb.label} ({bulb.ip})"
         details: List[str] = []
         if bulb.scene_id is not None:
-            scene_name = SCENES.get(bulb.scene_id)
-            if scene_name:
-                details.append(f"scene={bulb.scene_id}:{scene_name}")
-            else:
-                details.append(f"scene={bulb.scene_id}")
+            scene = _SCENE_DETAIL.get(bulb.scene_id)
+            details.append(scene if scene is not None else f"scene={bulb.scene_id}")
         if bulb.brightness is not None:
             details.append(f"bri={bulb.brightness}")
         if bulb.rgb:
-            details.append(f"rgb={bulb.rgb[0]},{bulb.rgb[1]},{bulb.rgb[2]}")
+            red, green, blue = bulb.rgb
+            details.append(f"rgb={red},{green},{blue}")
         if bulb.last_error:
             details.append(f"! {bulb.last_error}")
         if details:
-            parts.append("  ".join(details))
-        return "  ".join(parts)
+            return f"{line}  {'  '.join(details)}"
+        return line
 
     def _prompt(self, prompt: str) -> Optional[str]:
         height, width = self.stdscr.getmaxyx()
-        try:
-            self.stdscr.move(height - 1, 0)
-            self.stdscr.clrtoeol()
-        except self._curses.error:  # pragma: no cover - terminal dependent
-            pass
-        self._safe_add(height - 1, 0, prompt, width, self._curses.A_BOLD)
+        prompt_len = len(prompt)
+        # _safe_add pads the whole line, so the footer needs no separate clear.
+        self._safe_add(height - 1, 0, prompt, width, self._A_BOLD, max_y=height)
         try:
             self._curses.echo()
             self.stdscr.refresh()
-        except self._curses.error:  # pragma: no cover - terminal dependent
+        except self._curses_error:  # pragma: no cover - terminal dependent
             pass
+        # getstr stops reading at the first getch timeout, so block while prompting.
+        self.stdscr.timeout(-1)
         try:
-            raw = self.stdscr.getstr(height - 1, len(prompt), max(1, width - len(prompt) - 1))
-        except self._curses.error:  # pragma: no cover - terminal dependent
+            raw = self.stdscr.getstr(height - 1, prompt_len, max(1, width - prompt_len - 1))
+        except self._curses_error:  # pragma: no cover - terminal dependent
             raw = b""
         finally:
+            self.stdscr.timeout(_RESULT_POLL_MS)
+            # getstr echoed into the footer line behind _safe_add's back.
+            self._line_cache.pop(height - 1, None)
+            self._invalidate("footer")
             try:
                 self._curses.noecho()
-            except self._curses.error:  # pragma: no cover - terminal dependent
+            except self._curses_error:  # pragma: no cover - terminal dependent
                 pass
-        text = raw.decode(errors="ignore").strip()
+        # Blank input cancels the prompt.
+        if not raw:
+            return None
+        text = raw.strip().decode("utf-8", "ignore")
         if not text:
             return None
         return text
@@ -919,10 +1336,16 @@ class WizTUI:
             raise ValueError("RGB value is required.")
         if value.startswith("#"):
             hex_value = value[1:]
-            if len(hex_value) != 6 or not all(c in "0123456789abcdefABCDEF" for c in hex_value):
+            # fromhex skips spaces between byte pairs, but with exactly six
+            # characters any space leaves fewer than three bytes.
+            try:
+                channels = bytes.fromhex(hex_value) if len(hex_value) == 6 else b""
+            except ValueError:
+                channels = b""
+            if len(channels) != 3:
                 raise ValueError("RGB hex must be in the form #RRGGBB.")
-            return tuple(int(hex_value[i : i + 2], 16) for i in (0, 2, 4))  # type: ignore[return-value]
-        parts = [part for part in re.split(r"[ ,]+", value) if part]
+            return channels[0], channels[1], channels[2]
+        parts = value.replace(",", " ").split()
         if len(parts) != 3:
             raise ValueError("RGB must have three components (e.g. 255,128,0).")
         try:
@@ -937,42 +1360,39 @@ class WizTUI:
         text = token.strip()
         if not text:
             raise ValueError("Scene id or name is required.")
-        if text.isdigit():
-            return int(text)
+        try:
+            scene_id = int(text)
+        except ValueError:
+            pass
+        else:
+            if scene_id >= 0:
+                return scene_id
         lower = text.lower()
-        exact_matches = [scene_id for scene_id, name in SCENES.items() if name.lower() == lower]
-        if exact_matches:
-            return exact_matches[0]
-        partial_matches = [scene_id for scene_id, name in SCENES.items() if lower in name.lower()]
-        if partial_matches:
-            return partial_matches[0]
+        scene_id = _SCENE_BY_NAME.get(lower)
+        if scene_id is not None:
+            return scene_id
+        for scene_id, name in _SCENE_LOWER_PAIRS:
+            if lower in name:
+                return scene_id
         raise ValueError(f"Unknown scene '{token}'.")
 
     def _has_selection(self) -> bool:
         if not self.bulbs:
             self.status_message = "No bulbs available. Press r to rescan."
-            self.draw()
             return False
         return True
 
     def _format_status_summary(self, bulb: BulbInfo) -> str:
-        if bulb.state is True:
-            status = "on"
-        elif bulb.state is False:
-            status = "off"
-        else:
-            status = "unknown"
+        status = _STATE_WORD.get(bulb.state, "unknown")
         extras: List[str] = []
         if bulb.brightness is not None:
             extras.append(f"bri {bulb.brightness}")
         if bulb.rgb:
-            extras.append(f"rgb {bulb.rgb[0]},{bulb.rgb[1]},{bulb.rgb[2]}")
+            red, green, blue = bulb.rgb
+            extras.append(f"rgb {red},{green},{blue}")
         if bulb.scene_id is not None:
-            scene_name = SCENES.get(bulb.scene_id)
-            if scene_name:
-                extras.append(f"scene {bulb.scene_id}:{scene_name}")
-            else:
-                extras.append(f"scene {bulb.scene_id}")
+            scene = _SCENE_STATUS.get(bulb.scene_id)
+            extras.append(scene if scene is not None else f"scene {bulb.scene_id}")
         if extras:
             return f"{status} ({', '.join(extras)})"
         return status